@@ -1,11 +1,16 @@
 """Implementation of a Queue data structure using a doubly linked list in Python.
 
+Nodes are slotted, and an optional NodePool recycles the nodes dropped by
+dequeue and clear.
+
 Author: Mohsin Jafari
 GitHub: https://github.com/mohsinjafari
 """
 
 class Node:
     """A node in a doubly linked list."""
+    __slots__ = ("data", "next", "prev")
+
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -14,15 +19,22 @@ class Node:
 
 class Queue:
     """A Queue data structure implemented using a doubly linked list."""
-    def __init__(self):
+    def __init__(self, pool=None):
+        """
+        pool (NodePool, optional): recycles nodes dropped by dequeue and clear.
+        A pooled queue must not be modified while it is being iterated.
+        """
+        if pool is not None and not issubclass(pool.node_class, Node):
+            raise TypeError("pool must be a NodePool of this module's Node")
         self.head = None
         self.tail = None
         self.length = 0
+        self.pool = pool
 
     
     "Basic operations"
     def enqueue(self, data):
-        new_node = Node(data)
+        new_node = Node(data) if self.pool is None else self.pool.acquire(data)
         if self.head == None:
             self.head = new_node
             self.tail = new_node
@@ -36,14 +48,29 @@ class Queue:
         if self.head == None:
             return None
         else:
-            val = self.tail.data
-            self.tail = self.tail.prev
+            node = self.tail
+            val = node.data
+            self.tail = node.prev
             if self.tail == None:
                 self.head = None
             else:
                 self.tail.next = None   
             self.length -= 1
+            if self.pool is not None:
+                node.prev = None
+                self.pool.release(node)
             return val
+
+    def clear(self):
+        if self.pool is not None:
+            node = self.head
+            while node:
+                node.prev = None
+                node = node.next
+            self.pool.release_chain(self.head)
+        self.head = None
+        self.tail = None
+        self.length = 0
     
 
     def is_empty(self):
@@ -0,0 +1,298 @@
+"""
+array_bst.py
+----------------
+A compact, array-backed Binary Search Tree (BST) for millions of keys.
+
+Instead of one Python object per node, the tree is stored as three
+parallel array.array columns: the keys, and the index of each node's
+left and right child (-1 for no child). Keys are stored unboxed, so a
+node costs 16 bytes with the default typecodes, compared with well over
+100 bytes for a BSTNode holding an int.
+
+Features:
+- Add child (insert new keys), duplicates ignored
+- Inorder, Preorder, Postorder traversals (lists and lazy generators)
+- Search for a value
+- Compute tree height
+- Find maximum and minimum values
+- Build a balanced tree from sorted data in O(n)
+- Memory benchmark against BSTNode
+
+Author: Mohsin Jafari
+GitHub: https://github.com/mohsinjafari
+"""
+
+import tracemalloc
+from array import array
+
+from bst import bulk_load
+
+NO_CHILD = -1
+
+
+class ArrayBST:
+    """
+    A Binary Search Tree stored in parallel arrays.
+    key_typecode selects the key column type ("q" for 64-bit integers,
+    "d" for floats); child links are 32-bit indices.
+    """
+
+    def __init__(self, elements=None, key_typecode="q"):
+        self.keys = array(key_typecode)
+        self.left = array("i")
+        self.right = array("i")
+        self.root = NO_CHILD
+        if elements is not None:
+            for elem in elements:
+                self.add_child(elem)
+
+    @classmethod
+    def from_sorted(cls, values, key_typecode="q"):
+        """
+        Creates a perfectly balanced tree from sorted, duplicate-free values.
+        Node i holds values[i], so the key column is the sorted input itself
+        and only the child links need to be computed.
+        """
+        tree = cls(key_typecode=key_typecode)
+        n = len(values)
+        tree.keys = array(key_typecode, values)
+        tree.left = array("i", [NO_CHILD]) * n
+        tree.right = array("i", [NO_CHILD]) * n
+        if n == 0:
+            return tree
+
+        tree.root = (n - 1) // 2
+        stack = [(0, n, tree.root)]
+        while stack:
+            lo, hi, mid = stack.pop()
+            if lo < mid:
+                child = (lo + mid - 1) // 2
+                tree.left[mid] = child
+                stack.append((lo, mid, child))
+            if mid + 1 < hi:
+                child = (mid + 1 + hi - 1) // 2
+                tree.right[mid] = child
+                stack.append((mid + 1, hi, child))
+        return tree
+
+    # -------------------------------
+    # Insert a new key (add_child)
+    # -------------------------------
+    def add_child(self, data):
+        """
+        Adds a new key to the tree in the correct position.
+        Duplicate values are ignored.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        parent, links = NO_CHILD, None
+        node = self.root
+        while node != NO_CHILD:
+            key = keys[node]
+            if data == key:
+                return  # Ignore duplicate
+            parent = node
+            links = left if data < key else right
+            node = links[node]
+
+        # Store the key first: if it does not fit the key column (e.g. a
+        # float in a "q" tree) append raises and the tree is unchanged.
+        keys.append(data)
+        new = len(keys) - 1
+        left.append(NO_CHILD)
+        right.append(NO_CHILD)
+        if parent == NO_CHILD:
+            self.root = new
+        else:
+            links[parent] = new
+
+    # -------------------------------
+    # Search for a value
+    # -------------------------------
+    def search(self, value):
+        """
+        Returns True if value exists in the tree, otherwise False.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        node = self.root
+        while node != NO_CHILD:
+            key = keys[node]
+            if value == key:
+                return True
+            node = left[node] if value < key else right[node]
+        return False
+
+    # -------------------------------
+    # Lazy traversals
+    # -------------------------------
+    def iter_inorder(self):
+        """
+        Yields keys in ascending order (Left → Node → Right).
+        """
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        node = self.root
+        while stack or node != NO_CHILD:
+            while node != NO_CHILD:
+                stack.append(node)
+                node = left[node]
+            node = stack.pop()
+            yield keys[node]
+            node = right[node]
+
+    def iter_preorder(self):
+        """
+        Yields keys in preorder (Node → Left → Right).
+        """
+        keys, left, right = self.keys, self.left, self.right
+        stack = [self.root] if self.root != NO_CHILD else []
+        while stack:
+            node = stack.pop()
+            yield keys[node]
+            if right[node] != NO_CHILD:
+                stack.append(right[node])
+            if left[node] != NO_CHILD:
+                stack.append(left[node])
+
+    def iter_postorder(self):
+        """
+        Yields keys in postorder (Left → Right → Node).
+        """
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        node = self.root
+        last_visited = NO_CHILD
+        while stack or node != NO_CHILD:
+            if node != NO_CHILD:
+                stack.append(node)
+                node = left[node]
+            else:
+                top = stack[-1]
+                if right[top] != NO_CHILD and right[top] != last_visited:
+                    node = right[top]
+                else:
+                    yield keys[top]
+                    last_visited = stack.pop()
+
+    def inorder_traversal(self):
+        """
+        Returns keys in ascending order (Left → Node → Right).
+        """
+        return list(self.iter_inorder())
+
+    def preorder_traversal(self):
+        """
+        Returns keys in preorder (Node → Left → Right).
+        """
+        return list(self.iter_preorder())
+
+    def postorder_traversal(self):
+        """
+        Returns keys in postorder (Left → Right → Node).
+        """
+        return list(self.iter_postorder())
+
+    # -------------------------------
+    # Tree properties
+    # -------------------------------
+    def height(self):
+        """
+        Returns the height (maximum depth) of the tree, 0 when empty.
+        Computed level by level, without recursion.
+        """
+        left, right = self.left, self.right
+        level = [self.root] if self.root != NO_CHILD else []
+        height = 0
+        while level:
+            height += 1
+            next_level = []
+            for node in level:
+                if left[node] != NO_CHILD:
+                    next_level.append(left[node])
+                if right[node] != NO_CHILD:
+                    next_level.append(right[node])
+            level = next_level
+        return height
+
+    def max_val(self):
+        """
+        Returns the maximum key stored in the tree.
+        """
+        if self.root == NO_CHILD:
+            raise ValueError("max_val of empty tree")
+        node = self.root
+        while self.right[node] != NO_CHILD:
+            node = self.right[node]
+        return self.keys[node]
+
+    def min_val(self):
+        """
+        Returns the minimum key stored in the tree.
+        """
+        if self.root == NO_CHILD:
+            raise ValueError("min_val of empty tree")
+        node = self.root
+        while self.left[node] != NO_CHILD:
+            node = self.left[node]
+        return self.keys[node]
+
+    def nbytes(self):
+        """
+        Returns the number of bytes used by the three columns.
+        """
+        return sum(col.itemsize * len(col) for col in (self.keys, self.left, self.right))
+
+    # -------------------------------
+    # Magic methods
+    # -------------------------------
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self):
+        return self.iter_inorder()
+
+    def __contains__(self, value):
+        return self.search(value)
+
+    def __repr__(self):
+        return f"ArrayBST({len(self)} keys, height={self.height()})"
+
+
+# ========================================
+# Memory Benchmark
+# ========================================
+def memory_benchmark(n):
+    """
+    Builds a balanced tree of n integer keys (well above the small-int
+    cache) with BSTNode and with ArrayBST, and returns the bytes each
+    allocates, as measured by tracemalloc.
+    """
+    values = range(1_000_000, 1_000_000 + n)
+    results = {}
+    for name, build in (("BSTNode", bulk_load), ("ArrayBST", ArrayBST.from_sorted)):
+        tracemalloc.start()
+        tree = build(values)
+        results[name], _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del tree
+    results["ratio"] = results["BSTNode"] / max(results["ArrayBST"], 1)
+    return results
+
+
+# ========================================
+# Example Usage
+# ========================================
+if __name__ == "__main__":
+    tree = ArrayBST([15, 12, 27, 7, 14, 20, 88, 23])
+    print("Inorder Traversal:", tree.inorder_traversal())
+    print("Preorder Traversal:", tree.preorder_traversal())
+    print("Search 20:", tree.search(20))
+    print("Height:", tree.height())
+    print("Max Value:", tree.max_val())
+    print("Min Value:", tree.min_val())
+
+    for n in (10_000, 100_000):
+        result = memory_benchmark(n)
+        print(
+            f"n={n}: BSTNode {result['BSTNode']:,} bytes, "
+            f"ArrayBST {result['ArrayBST']:,} bytes ({result['ratio']:.1f}x smaller)"
+        )
@@ -6,16 +6,28 @@ A simple and efficient implementation of a Binary Search Tree (BST) in Python.
 Features:
 - Add child (insert new nodes)
 - Inorder, Preorder, Postorder traversals
+- Lazy iterative traversal generators (in-order, reverse in-order, pre/post-order)
 - Reverse BST
 - Search for a value
 - Compute tree height
 - Find maximum and minimum values
 - Build BST from a list
+- Self-balancing AVL variant (BalancedBST) with the same API
+- O(n) bulk loading of a perfectly balanced BST, and batch merging
+- Order statistics and range queries (rank, select, count_range, range)
+- Delete, floor and ceiling
+- Ordered key/value map (BSTMap): get, put, delete, pop_min, floor, ceiling
+- Cached height, size, min and max per node (O(1) queries) with validation
 
 Author: Mohsin Jafari
 GitHub: https://github.com/mohsinjafari
 """
 
+# When True, every add_child/delete re-checks all cached values against a
+# full recompute (O(n) per change). Meant for tests only.
+VALIDATE_CACHES = False
+
+
 # ========================================
 # Binary Search Tree (BST) Implementation
 # ========================================
@@ -24,12 +36,21 @@ class BSTNode:
     """
     A class representing a node in a Binary Search Tree (BST).
     Each node contains a data value and references to left and right children.
+    Nodes use __slots__ (no per-instance __dict__) to keep large trees small.
+    Each node also caches the size, height, minimum and maximum of its
+    subtree; they are kept up to date on insert, delete and reverse.
     """
 
+    __slots__ = ("data", "left", "right", "size", "subtree_height", "min_data", "max_data")
+
     def __init__(self, data):
         self.data = data
         self.left = None
         self.right = None
+        self.size = 1
+        self.subtree_height = 1
+        self.min_data = data
+        self.max_data = data
 
     # -------------------------------
     # Insert a new node (add_child)
@@ -38,22 +59,144 @@ class BSTNode:
         """
         Adds a new node to the BST in the correct position.
         Duplicate values are ignored (no duplicates allowed in BST).
+        Iterative, so degenerate trees do not hit the recursion limit.
         """
-        if data == self.data:
-            return  # Ignore duplicate
+        path = []
+        node = self
+        while node:
+            if data == node.data:
+                return  # Ignore duplicate
+            path.append(node)
+            node = node.left if data < node.data else node.right
 
-        if data < self.data:
-            # Insert into left subtree
-            if self.left:
-                self.left.add_child(data)
-            else:
-                self.left = BSTNode(data)
+        parent = path[-1]
+        if data < parent.data:
+            parent.left = BSTNode(data)
+        else:
+            parent.right = BSTNode(data)
+        _refresh_path(path)
+
+        if VALIDATE_CACHES:
+            self.validate()
+
+    # -------------------------------
+    # Delete a value
+    # -------------------------------
+    def delete(self, value):
+        """
+        Removes value from the BST (if present) and returns the new root
+        of the tree, which is None once the last value is removed:
+            root = root.delete(value)
+        A node with two children is replaced by its in-order successor
+        node, so nodes are relinked rather than having their data copied.
+        """
+        path = []
+        node = self
+        while node and value != node.data:
+            path.append(node)
+            node = node.left if value < node.data else node.right
+        if node is None:
+            return self  # Value not present
+
+        if node.left is None or node.right is None:
+            replacement = node.left or node.right
         else:
-            # Insert into right subtree
-            if self.right:
-                self.right.add_child(data)
+            # Detach the successor (leftmost node of the right subtree).
+            succ_path = []
+            succ = node.right
+            while succ.left:
+                succ_path.append(succ)
+                succ = succ.left
+            if succ_path:
+                succ_path[-1].left = succ.right
+                succ.right = node.right
+            succ.left = node.left
+            _refresh_path(succ_path)
+            _refresh(succ)
+            replacement = succ
+
+        if path:
+            parent = path[-1]
+            if parent.left is node:
+                parent.left = replacement
             else:
-                self.right = BSTNode(data)
+                parent.right = replacement
+            _refresh_path(path)
+        root = path[0] if path else replacement
+
+        if VALIDATE_CACHES and root:
+            root.validate()
+        return root
+
+    # -------------------------------
+    # Lazy traversals (iterative generators)
+    # -------------------------------
+    def iter_inorder(self):
+        """
+        Yields elements in ascending order (Left → Node → Right), one at a
+        time, using an explicit stack instead of recursion.
+        """
+        stack = []
+        node = self
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.data
+            node = node.right
+
+    def iter_reverse_inorder(self):
+        """
+        Yields elements in descending order (Right → Node → Left).
+        """
+        stack = []
+        node = self
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.right
+            node = stack.pop()
+            yield node.data
+            node = node.left
+
+    def iter_preorder(self):
+        """
+        Yields elements in preorder (Node → Left → Right).
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node.data
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+
+    def iter_postorder(self):
+        """
+        Yields elements in postorder (Left → Right → Node).
+        """
+        stack = []
+        node = self
+        last_visited = None
+        while stack or node:
+            if node:
+                stack.append(node)
+                node = node.left
+            else:
+                top = stack[-1]
+                if top.right and top.right is not last_visited:
+                    node = top.right
+                else:
+                    yield top.data
+                    last_visited = stack.pop()
+
+    def __iter__(self):
+        return self.iter_inorder()
+
+    def __reversed__(self):
+        return self.iter_reverse_inorder()
 
     # -------------------------------
     # Inorder Traversal (LNR)
@@ -62,16 +205,16 @@ class BSTNode:
         """
         Returns elements in ascending order (Left → Node → Right).
         """
-        elements = []
-        if self.left:
-            elements += self.left.inorder_traversal()
+        return list(self.iter_inorder())
 
-        elements.append(self.data)
-
-        if self.right:
-            elements += self.right.inorder_traversal()
-
-        return elements
+    # -------------------------------
+    # Reverse Inorder Traversal (RNL)
+    # -------------------------------
+    def reverse_inorder(self):
+        """
+        Returns elements in descending order (Right → Node → Left).
+        """
+        return list(self.iter_reverse_inorder())
 
     # -------------------------------
     # Preorder Traversal (NLR)
@@ -80,14 +223,7 @@ class BSTNode:
         """
         Returns elements in preorder (Node → Left → Right).
         """
-        elements = [self.data]
-
-        if self.left:
-            elements += self.left.preorder_traversal()
-        if self.right:
-            elements += self.right.preorder_traversal()
-
-        return elements
+        return list(self.iter_preorder())
 
     # -------------------------------
     # Postorder Traversal (LRN)
@@ -96,28 +232,106 @@ class BSTNode:
         """
         Returns elements in postorder (Left → Right → Node).
         """
-        elements = []
+        return list(self.iter_postorder())
+
+    # -------------------------------
+    # Order statistics and range queries
+    # -------------------------------
+    def rank(self, value):
+        """
+        Returns the number of values in the BST smaller than value, in O(h).
+        """
+        count = 0
+        node = self
+        while node:
+            if value < node.data:
+                node = node.left
+            else:
+                left_size = node.left.size if node.left else 0
+                if value == node.data:
+                    return count + left_size
+                count += left_size + 1
+                node = node.right
+        return count
+
+    def _count_at_most(self, value):
+        """
+        Returns the number of values in the BST less than or equal to value.
+        """
+        count = 0
+        node = self
+        while node:
+            if value < node.data:
+                node = node.left
+            else:
+                count += (node.left.size if node.left else 0) + 1
+                node = node.right
+        return count
+
+    def select(self, k):
+        """
+        Returns the k-th smallest value (0-based) in O(h).
+        """
+        if not 0 <= k < self.size:
+            raise IndexError("select index out of range")
+        node = self
+        while True:
+            left_size = node.left.size if node.left else 0
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.data
+            else:
+                k -= left_size + 1
+                node = node.right
 
-        if self.left:
-            elements += self.left.postorder_traversal()
-        if self.right:
-            elements += self.right.postorder_traversal()
+    def count_range(self, lo, hi):
+        """
+        Returns how many values lie in [lo, hi], in O(h).
+        """
+        if hi < lo:
+            return 0
+        return self._count_at_most(hi) - self.rank(lo)
 
-        elements.append(self.data)
-        return elements
+    def range(self, lo, hi):
+        """
+        Yields the values in [lo, hi] in ascending order, visiting only
+        the subtrees that can contain them.
+        """
+        stack = []
+        node = self
+        while stack or node:
+            while node:
+                if node.data < lo:
+                    node = node.right  # Node and its left subtree are too small
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if hi < node.data:
+                return
+            yield node.data
+            node = node.right
 
     # -------------------------------
     # Reverse BST
     # -------------------------------
     def reverse(self):
         """
-        reverses the BST by swapping left and right children recursively.
+        reverses the BST by swapping left and right children at every node.
+        Subtree size, height, minimum and maximum are unchanged by mirroring,
+        so the cached values stay valid.
         """
-        self.left, self.right = self.right, self.left  # Swap children
-        if self.left:
-            self.left.reverse()
-        if self.right:
-            self.right.reverse()
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node.left, node.right = node.right, node.left  # Swap children
+            if node.left:
+                stack.append(node.left)
+            if node.right:
+                stack.append(node.right)
 
     # -------------------------------
     # Search for a value
@@ -126,51 +340,398 @@ class BSTNode:
         """
         Returns True if value exists in the BST, otherwise False.
         """
-        if value == self.data:
-            return True
+        node = self
+        while node:
+            if value == node.data:
+                return True
+            node = node.left if value < node.data else node.right
+        return False
 
-        if value < self.data:
-            return self.left.search(value) if self.left else False
-        else:
-            return self.right.search(value) if self.right else False
+    # -------------------------------
+    # Floor and ceiling
+    # -------------------------------
+    def _floor_node(self, value):
+        """
+        Returns the node with the largest value <= value, or None.
+        """
+        best = None
+        node = self
+        while node:
+            if value < node.data:
+                node = node.left
+            else:
+                best = node
+                if value == node.data:
+                    break
+                node = node.right
+        return best
+
+    def _ceiling_node(self, value):
+        """
+        Returns the node with the smallest value >= value, or None.
+        """
+        best = None
+        node = self
+        while node:
+            if node.data < value:
+                node = node.right
+            else:
+                best = node
+                if value == node.data:
+                    break
+                node = node.left
+        return best
+
+    def floor(self, value):
+        """
+        Returns the largest value in the BST <= value, or None.
+        """
+        node = self._floor_node(value)
+        return node.data if node else None
+
+    def ceiling(self, value):
+        """
+        Returns the smallest value in the BST >= value, or None.
+        """
+        node = self._ceiling_node(value)
+        return node.data if node else None
 
     # -------------------------------
     # Find the height of the tree
     # -------------------------------
     def height(self):
         """
-        Returns the height (maximum depth) of the BST.
+        Returns the height (maximum depth) of the BST in O(1).
         """
-        max_height = 0
-        if self.left:
-            max_height = max(max_height, self.left.height())
-        if self.right:
-            max_height = max(max_height, self.right.height())
-        return max_height + 1
+        return self.subtree_height
 
     # -------------------------------
     # Find the maximum value in the tree
     # -------------------------------
     def max_val(self):
         """
-        Returns the maximum value stored in the BST.
+        Returns the maximum value stored in the BST in O(1).
         """
-        current = self
-        while current.right:
-            current = current.right 
-        return current.data
+        return self.max_data
 
     # -------------------------------
     # Find the minimum value in the tree
     # -------------------------------
     def min_val(self):
         """
-        Returns the minimum value stored in the BST.
+        Returns the minimum value stored in the BST in O(1).
+        """
+        return self.min_data
+
+    # -------------------------------
+    # Validate cached values
+    # -------------------------------
+    def validate(self):
+        """
+        Recomputes size, height, min and max for every node from scratch
+        and raises AssertionError if any cached value differs.
+        Returns True when all caches are correct. Intended for tests.
+        """
+        computed = {}
+        for node in _iter_nodes_postorder(self):
+            size, height = 1, 1
+            low = high = node.data
+            for child in (node.left, node.right):
+                if child:
+                    c_size, c_height, c_low, c_high = computed.pop(id(child))
+                    size += c_size
+                    height = max(height, c_height + 1)
+                    if c_low < low:
+                        low = c_low
+                    if high < c_high:
+                        high = c_high
+            actual = (node.size, node.subtree_height, node.min_data, node.max_data)
+            if actual != (size, height, low, high):
+                raise AssertionError(
+                    f"stale cache at {node.data!r}: cached {actual}, "
+                    f"recomputed {(size, height, low, high)}"
+                )
+            computed[id(node)] = (size, height, low, high)
+        return True
+
+
+# ========================================
+# Cached value maintenance
+# ========================================
+def _height(node):
+    return node.subtree_height if node else 0
+
+
+def _refresh(node):
+    """
+    Recomputes the cached size, height, min and max of node from its
+    children in O(1). The min/max do not assume an ordering between the
+    children, so they remain correct for a reversed tree.
+    """
+    left, right = node.left, node.right
+    size, height = 1, 0
+    low = high = node.data
+    if left:
+        size += left.size
+        height = left.subtree_height
+        if left.min_data < low:
+            low = left.min_data
+        if high < left.max_data:
+            high = left.max_data
+    if right:
+        size += right.size
+        if right.subtree_height > height:
+            height = right.subtree_height
+        if right.min_data < low:
+            low = right.min_data
+        if high < right.max_data:
+            high = right.max_data
+    node.size = size
+    node.subtree_height = height + 1
+    node.min_data = low
+    node.max_data = high
+
+
+def _refresh_path(path):
+    """
+    Refreshes the nodes of a root-to-leaf path, deepest first.
+    """
+    for node in reversed(path):
+        _refresh(node)
+
+
+def _iter_nodes_postorder(root):
+    """
+    Yields the nodes of the tree in postorder (children before parents).
+    """
+    stack = [(root, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if children_done:
+            yield node
+            continue
+        stack.append((node, True))
+        if node.right:
+            stack.append((node.right, False))
+        if node.left:
+            stack.append((node.left, False))
+
+
+# ========================================
+# Self-Balancing (AVL) Variant
+# ========================================
+
+class AVLNode(BSTNode):
+    """
+    A BST node managed by BalancedBST, which uses the cached subtree
+    heights to keep the tree balanced. It shares BSTNode's read-only
+    queries, but the plain BST mutators would skip rebalancing and leave
+    BalancedBST's length stale, so they raise TypeError.
+    """
+
+    __slots__ = ()
+
+    def add_child(self, data):
+        raise TypeError("AVLNode cannot be modified directly; use BalancedBST.add_child")
+
+    def delete(self, value):
+        raise TypeError("AVLNode cannot be modified directly; BalancedBST is insert-only, "
+                        "so rebuild it with build_balanced_tree to remove values")
+
+
+def _rotate_left(node):
+    """
+    Rotates the subtree left and returns its new root.
+    """
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _refresh(node)
+    _refresh(pivot)
+    return pivot
+
+
+def _rotate_right(node):
+    """
+    Rotates the subtree right and returns its new root.
+    """
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _refresh(node)
+    _refresh(pivot)
+    return pivot
+
+
+def _rebalance(node):
+    """
+    Restores the AVL property (child heights differ by at most one)
+    at node and returns the root of the rebalanced subtree.
+    """
+    _refresh(node)
+    balance = _height(node.left) - _height(node.right)
+
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+
+    return node
+
+
+class BalancedBST:
+    """
+    A self-balancing Binary Search Tree (AVL tree) with the same API as
+    BSTNode. The height stays O(log n) under any insertion order,
+    including already-sorted input, and insertion is iterative, so
+    large trees never hit the recursion limit.
+    """
+
+    def __init__(self):
+        self.root = None
+        self.length = 0
+
+    # -------------------------------
+    # Insert a new node (add_child)
+    # -------------------------------
+    def add_child(self, data):
+        """
+        Adds a new value to the tree and rebalances along the insertion path.
+        Duplicate values are ignored.
+        """
+        if self.root is None:
+            self.root = AVLNode(data)
+            self.length = 1
+            return
+
+        path = []
+        node = self.root
+        while node:
+            if data == node.data:
+                return  # Ignore duplicate
+            path.append(node)
+            node = node.left if data < node.data else node.right
+
+        parent = path[-1]
+        if data < parent.data:
+            parent.left = AVLNode(data)
+        else:
+            parent.right = AVLNode(data)
+        self.length += 1
+
+        # Walk back up, rebalancing and relinking each subtree root.
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            new_root = _rebalance(node)
+            if i == 0:
+                self.root = new_root
+            elif path[i - 1].left is node:
+                path[i - 1].left = new_root
+            else:
+                path[i - 1].right = new_root
+
+    # -------------------------------
+    # Traversals
+    # -------------------------------
+    def inorder_traversal(self):
+        """
+        Returns elements in ascending order (Left → Node → Right).
+        """
+        return self.root.inorder_traversal() if self.root else []
+
+    def preorder_traversal(self):
+        """
+        Returns elements in preorder (Node → Left → Right).
+        """
+        return self.root.preorder_traversal() if self.root else []
+
+    def postorder_traversal(self):
+        """
+        Returns elements in postorder (Left → Right → Node).
+        """
+        return self.root.postorder_traversal() if self.root else []
+
+    def reverse_inorder(self):
+        """
+        Returns elements in descending order (Right → Node → Left).
+        """
+        return self.root.reverse_inorder() if self.root else []
+
+    def __iter__(self):
+        return self.root.iter_inorder() if self.root else iter(())
+
+    def __reversed__(self):
+        return self.root.iter_reverse_inorder() if self.root else iter(())
+
+    # -------------------------------
+    # Queries
+    # -------------------------------
+    def search(self, value):
+        """
+        Returns True if value exists in the tree, otherwise False.
+        """
+        node = self.root
+        while node:
+            if value == node.data:
+                return True
+            node = node.left if value < node.data else node.right
+        return False
+
+    def height(self):
+        """
+        Returns the height of the tree in O(1) (0 for an empty tree).
+        """
+        return _height(self.root)
+
+    def max_val(self):
+        """
+        Returns the maximum value stored in the tree.
+        """
+        if self.root is None:
+            raise ValueError("max_val of empty tree")
+        return self.root.max_val()
+
+    def min_val(self):
+        """
+        Returns the minimum value stored in the tree.
+        """
+        if self.root is None:
+            raise ValueError("min_val of empty tree")
+        return self.root.min_val()
+
+    def rank(self, value):
+        """
+        Returns the number of values in the tree smaller than value.
+        """
+        return self.root.rank(value) if self.root else 0
+
+    def select(self, k):
         """
-        current = self
-        while current.left:
-            current = current.left 
-        return current.data
+        Returns the k-th smallest value (0-based).
+        """
+        if self.root is None:
+            raise IndexError("select index out of range")
+        return self.root.select(k)
+
+    def count_range(self, lo, hi):
+        """
+        Returns how many values lie in [lo, hi].
+        """
+        return self.root.count_range(lo, hi) if self.root else 0
+
+    def range(self, lo, hi):
+        """
+        Yields the values in [lo, hi] in ascending order.
+        """
+        return self.root.range(lo, hi) if self.root else iter(())
+
+    def __len__(self):
+        return self.length
 
 
 # ========================================
@@ -189,6 +750,263 @@ def build_tree(elements):
     return root
 
 
+def build_balanced_tree(elements):
+    """
+    Creates a self-balancing BST (BalancedBST) from a list of elements.
+    """
+    tree = BalancedBST()
+    for elem in elements:
+        tree.add_child(elem)
+    return tree
+
+
+# ========================================
+# Bulk Loading
+# ========================================
+def _sorted_unique(elements):
+    """
+    Returns the elements sorted with duplicates removed.
+    Sorting is skipped when the input is already in order.
+    """
+    values = list(elements)
+    if any(values[i + 1] < values[i] for i in range(len(values) - 1)):
+        values.sort()
+
+    unique = values[:1]
+    for value in values[1:]:
+        if value != unique[-1]:
+            unique.append(value)
+    return unique
+
+
+def _build_from_sorted(values, lo, hi):
+    """
+    Builds a perfectly balanced subtree from the sorted, duplicate-free
+    values[lo:hi] by taking the middle value as the root.
+    Every node is created exactly once, so this runs in O(n).
+    """
+    if lo >= hi:
+        return None
+    mid = (lo + hi) // 2
+    node = BSTNode(values[mid])
+    node.left = _build_from_sorted(values, lo, mid)
+    node.right = _build_from_sorted(values, mid + 1, hi)
+    _refresh(node)
+    return node
+
+
+def bulk_load(elements):
+    """
+    Creates a perfectly balanced BST from elements in one pass.
+    The elements are sorted once if they are not already in order and
+    duplicates are dropped; building the tree itself is O(n).
+    Returns None for empty input.
+    """
+    values = _sorted_unique(elements)
+    return _build_from_sorted(values, 0, len(values))
+
+
+def _merge_unique(a, b):
+    """
+    Merges two sorted lists into one sorted list without duplicates.
+    """
+    result = []
+    i, j = 0, 0
+    while i < len(a) and j < len(b):
+        if b[j] < a[i]:
+            value = b[j]
+            j += 1
+        else:
+            value = a[i]
+            i += 1
+        if not result or result[-1] != value:
+            result.append(value)
+    for value in a[i:] + b[j:]:
+        if not result or result[-1] != value:
+            result.append(value)
+    return result
+
+
+def bulk_insert(root, elements):
+    """
+    Merges a batch of elements into the tree rooted at root and returns
+    the (possibly new) root.
+    The tree is descended while the whole batch lies on one side of the
+    current node; only the subtree where the batch straddles a node (or
+    the empty slot it falls into) is rebuilt, balanced, from the merge
+    of its values with the batch.
+    """
+    batch = _sorted_unique(elements)
+    if not batch:
+        return root
+
+    path, went_left = [], False
+    node = root
+    while node:
+        if batch[-1] < node.data:
+            path.append(node)
+            went_left, node = True, node.left
+        elif node.data < batch[0]:
+            path.append(node)
+            went_left, node = False, node.right
+        else:
+            break
+
+    values = _merge_unique(node.inorder_traversal(), batch) if node else batch
+    subtree = _build_from_sorted(values, 0, len(values))
+
+    if not path:
+        return subtree
+    if went_left:
+        path[-1].left = subtree
+    else:
+        path[-1].right = subtree
+    _refresh_path(path)
+    return root
+
+
+# ========================================
+# Ordered Map (key/value) on BSTNode
+# ========================================
+
+class MapNode(BSTNode):
+    """
+    A BST node that also stores the value associated with its key (data).
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, key, value):
+        super().__init__(key)
+        self.value = value
+
+
+class BSTMap:
+    """
+    An ordered key/value map backed by a (pointer-based) Binary Search Tree.
+    Keys are kept in sorted order; each key maps to one value.
+    """
+
+    def __init__(self):
+        self.root = None
+
+    def get(self, key, default=None):
+        """
+        Returns the value for key, or default if key is absent.
+        """
+        node = self.root
+        while node:
+            if key == node.data:
+                return node.value
+            node = node.left if key < node.data else node.right
+        return default
+
+    def put(self, key, value):
+        """
+        Associates value with key, replacing any previous value.
+        """
+        if self.root is None:
+            self.root = MapNode(key, value)
+            return
+
+        path = []
+        node = self.root
+        while node:
+            if key == node.data:
+                node.value = value
+                return
+            path.append(node)
+            node = node.left if key < node.data else node.right
+
+        parent = path[-1]
+        if key < parent.data:
+            parent.left = MapNode(key, value)
+        else:
+            parent.right = MapNode(key, value)
+        _refresh_path(path)
+
+    def delete(self, key):
+        """
+        Removes key and returns its value. Raises KeyError if key is absent.
+        """
+        node = self.root
+        while node and key != node.data:
+            node = node.left if key < node.data else node.right
+        if node is None:
+            raise KeyError(key)
+        self.root = self.root.delete(key)
+        return node.value
+
+    def pop_min(self):
+        """
+        Removes and returns the (key, value) pair with the smallest key.
+        """
+        if self.root is None:
+            raise KeyError("pop_min from empty map")
+        node = self.root
+        while node.left:
+            node = node.left
+        self.root = self.root.delete(node.data)
+        return node.data, node.value
+
+    def floor(self, key):
+        """
+        Returns the largest key <= key, or None.
+        """
+        return self.root.floor(key) if self.root else None
+
+    def ceiling(self, key):
+        """
+        Returns the smallest key >= key, or None.
+        """
+        return self.root.ceiling(key) if self.root else None
+
+    def items(self):
+        """
+        Yields (key, value) pairs in ascending key order.
+        """
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.data, node.value
+            node = node.right
+
+    def keys(self):
+        """
+        Yields the keys in ascending order.
+        """
+        return iter(self.root) if self.root else iter(())
+
+    def __len__(self):
+        return self.root.size if self.root else 0
+
+    def __contains__(self, key):
+        return self.root.search(key) if self.root else False
+
+    def __getitem__(self, key):
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __delitem__(self, key):
+        self.delete(key)
+
+    def __iter__(self):
+        return self.keys()
+
+    def __repr__(self):
+        return "BSTMap({" + ", ".join(f"{k!r}: {v!r}" for k, v in self.items()) + "})"
+
+
 # ========================================
 # Example Usage (Uncomment to Test)
 # ========================================
@@ -205,3 +1023,24 @@ if __name__ == "__main__":
     print("Height:", bst.height())
     print("Max Value:", bst.max_val())
     print("Min Value:", bst.min_val())
+    print("Rank of 20:", bst.rank(20))
+    print("3rd smallest:", bst.select(2))
+    print("Count in [12, 23]:", bst.count_range(12, 23))
+    print("Range [12, 23]:", list(bst.range(12, 23)))
+
+    bst = bst.delete(15)
+    print("After deleting 15:", bst.inorder_traversal())
+    print("Floor of 16:", bst.floor(16), "Ceiling of 16:", bst.ceiling(16))
+
+    ages = BSTMap()
+    for name, age in [("mohsin", 25), ("ali", 31), ("sara", 28)]:
+        ages.put(name, age)
+    print("Map:", ages)
+    print("pop_min:", ages.pop_min())
+
+    loaded = bulk_load(range(1, 1024))
+    loaded = bulk_insert(loaded, [2000, 1500, 500])
+    print("Bulk-loaded height:", loaded.height())
+
+    balanced = build_balanced_tree(range(1, 1024))
+    print("Balanced height for 1023 sorted keys:", balanced.height())
@@ -0,0 +1,210 @@
+"""
+bst_snapshot.py
+----------------
+Snapshot a Binary Search Tree to a compact binary file and query it
+straight from a memory-mapped view, without rebuilding any nodes.
+
+File layout (native byte order):
+- Header: magic, key typecode, node count, root index
+- Keys column: one 8-byte key per node, in ascending order
+- Left and right columns: 4-byte child index per node (-1 for none)
+
+Nodes are numbered in in-order, so the keys column is sorted: min and
+max are its first and last entries and range scans read it sequentially.
+The file is opened read-only, so several worker processes mapping the
+same snapshot share its pages through the OS page cache.
+
+Features:
+- save_snapshot: write a BSTNode tree (int or float keys) to a file
+- BSTSnapshot: search, min_val/max_val, range scans and iteration
+  directly off the mapped pages
+
+Author: Mohsin Jafari
+GitHub: https://github.com/mohsinjafari
+"""
+
+import mmap
+import struct
+from array import array
+from bisect import bisect_left
+
+MAGIC = b"BSTSNAP1"
+HEADER = struct.Struct("=8sc7xqq")  # magic, typecode, count, root
+NO_CHILD = -1
+
+
+# ========================================
+# Writing a snapshot
+# ========================================
+def save_snapshot(root, path):
+    """
+    Writes the tree rooted at root (a BSTNode, or None for an empty tree)
+    to path. Keys must all be ints (stored as 64-bit) or all floats.
+    Returns the number of nodes written.
+    """
+    # Number the nodes in in-order and record each node's children.
+    nodes = []
+    index = {}
+    stack = []
+    node = root
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        index[id(node)] = len(nodes)
+        nodes.append(node)
+        node = node.right
+
+    keys = [node.data for node in nodes]
+    if all(type(key) is float for key in keys) and keys:
+        typecode = "d"
+    else:
+        typecode = "q"
+    key_column = array(typecode, keys)
+    left = array("i", [index[id(n.left)] if n.left else NO_CHILD for n in nodes])
+    right = array("i", [index[id(n.right)] if n.right else NO_CHILD for n in nodes])
+    root_index = index[id(root)] if root else NO_CHILD
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, typecode.encode(), len(nodes), root_index))
+        key_column.tofile(f)
+        left.tofile(f)
+        right.tofile(f)
+    return len(nodes)
+
+
+# ========================================
+# Reading a snapshot
+# ========================================
+class BSTSnapshot:
+    """
+    A read-only view of a saved BST, answering queries from a memory map.
+    Use as a context manager, or call close() when done.
+    """
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, typecode, count, root = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a BST snapshot")
+
+        self.length = count
+        self.root = root
+        view = memoryview(self.map)
+        keys_start = HEADER.size
+        left_start = keys_start + 8 * count
+        right_start = left_start + 4 * count
+        self.keys = view[keys_start:left_start].cast(typecode.decode())
+        self.left = view[left_start:right_start].cast("i")
+        self.right = view[right_start:right_start + 4 * count].cast("i")
+        view.release()
+
+    # -------------------------------
+    # Queries
+    # -------------------------------
+    def search(self, value):
+        """
+        Returns True if value exists in the snapshot, otherwise False.
+        Follows the saved child links from the root.
+        """
+        keys, left, right = self.keys, self.left, self.right
+        node = self.root
+        while node != NO_CHILD:
+            key = keys[node]
+            if value == key:
+                return True
+            node = left[node] if value < key else right[node]
+        return False
+
+    def min_val(self):
+        """
+        Returns the minimum value in the snapshot.
+        """
+        if self.length == 0:
+            raise ValueError("min_val of empty snapshot")
+        return self.keys[0]
+
+    def max_val(self):
+        """
+        Returns the maximum value in the snapshot.
+        """
+        if self.length == 0:
+            raise ValueError("max_val of empty snapshot")
+        return self.keys[self.length - 1]
+
+    def range(self, lo, hi):
+        """
+        Yields the values in [lo, hi] in ascending order, reading the
+        sorted keys column sequentially from the first match.
+        """
+        keys = self.keys
+        i = bisect_left(keys, lo)
+        while i < self.length and not hi < keys[i]:
+            yield keys[i]
+            i += 1
+
+    def inorder_traversal(self):
+        """
+        Returns all values in ascending order.
+        """
+        return self.keys.tolist()
+
+    # -------------------------------
+    # Resource handling and magic methods
+    # -------------------------------
+    def close(self):
+        """
+        Releases the memory map and closes the file.
+        """
+        for name in ("keys", "left", "right"):
+            view = getattr(self, name, None)
+            if view is not None:
+                view.release()
+                setattr(self, name, None)
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.length
+
+    def __contains__(self, value):
+        return self.search(value)
+
+    def __iter__(self):
+        return iter(self.keys)
+
+    def __repr__(self):
+        return f"BSTSnapshot({self.length} keys)"
+
+
+# ========================================
+# Example Usage
+# ========================================
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    from bst import bulk_load
+
+    tree = bulk_load([15, 12, 27, 7, 14, 20, 88, 23])
+    path = os.path.join(tempfile.gettempdir(), "bst_example.snap")
+    print("Saved nodes:", save_snapshot(tree, path))
+
+    with BSTSnapshot(path) as snap:
+        print("Search 20:", snap.search(20))
+        print("Search 99:", snap.search(99))
+        print("Min Value:", snap.min_val())
+        print("Max Value:", snap.max_val())
+        print("Range [12, 23]:", list(snap.range(12, 23)))
+    os.remove(path)
@@ -0,0 +1,367 @@
+"""
+btree.py
+----------------
+An ordered key/value map backed by a B-tree, plus a benchmark against
+the pointer-based BSTMap from bst.py.
+
+A B-tree node holds up to (fanout - 1) sorted keys and fanout children,
+so a lookup touches only O(log_fanout n) nodes and each node is searched
+with a C-level bisect. Far fewer Python objects are created than with
+one node per key.
+
+Features:
+- get, put, delete, pop_min, floor, ceiling
+- Ordered iteration over keys and (key, value) pairs
+- Configurable node fanout
+- Lookup-heavy and insert-heavy benchmark against BSTMap
+
+Author: Mohsin Jafari
+GitHub: https://github.com/mohsinjafari
+"""
+
+import random
+import time
+from bisect import bisect_left, bisect_right
+
+from bst import BSTMap
+
+DEFAULT_FANOUT = 64
+
+
+class BTreeNode:
+    """A B-tree node: sorted keys, their values, and child nodes (empty for a leaf)."""
+
+    __slots__ = ("keys", "values", "children")
+
+    def __init__(self):
+        self.keys = []
+        self.values = []
+        self.children = []
+
+    def is_leaf(self):
+        return not self.children
+
+
+class BTreeMap:
+    """
+    An ordered key/value map stored in a B-tree.
+    fanout is the maximum number of children per node and must be even;
+    every node except the root keeps at least fanout // 2 - 1 keys.
+    """
+
+    def __init__(self, fanout=DEFAULT_FANOUT):
+        if fanout < 4 or fanout % 2:
+            raise ValueError("fanout must be an even number of at least 4")
+        self.min_degree = fanout // 2
+        self.root = BTreeNode()
+        self.length = 0
+
+    # ----------------------------
+    # Lookups
+    # ----------------------------
+    def get(self, key, default=None):
+        """Return the value for key, or default if key is absent."""
+        node = self.root
+        while True:
+            keys = node.keys
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                return node.values[i]
+            if not node.children:
+                return default
+            node = node.children[i]
+
+    def floor(self, key):
+        """Return the largest key <= key, or None."""
+        best = None
+        node = self.root
+        while True:
+            i = bisect_right(node.keys, key)
+            if i:
+                best = node.keys[i - 1]
+                if best == key:
+                    return best
+            if not node.children:
+                return best
+            node = node.children[i]
+
+    def ceiling(self, key):
+        """Return the smallest key >= key, or None."""
+        best = None
+        node = self.root
+        while True:
+            i = bisect_left(node.keys, key)
+            if i < len(node.keys):
+                best = node.keys[i]
+                if best == key:
+                    return best
+            if not node.children:
+                return best
+            node = node.children[i]
+
+    # ----------------------------
+    # Insertion
+    # ----------------------------
+    def _split_child(self, parent, i):
+        """Split the full child parent.children[i], moving its median key up."""
+        t = self.min_degree
+        child = parent.children[i]
+        right = BTreeNode()
+        right.keys = child.keys[t:]
+        right.values = child.values[t:]
+        if child.children:
+            right.children = child.children[t:]
+            del child.children[t:]
+
+        parent.keys.insert(i, child.keys[t - 1])
+        parent.values.insert(i, child.values[t - 1])
+        parent.children.insert(i + 1, right)
+        del child.keys[t - 1:]
+        del child.values[t - 1:]
+
+    def put(self, key, value):
+        """Associate value with key, replacing any previous value."""
+        max_keys = 2 * self.min_degree - 1
+        if len(self.root.keys) == max_keys:
+            old_root = self.root
+            self.root = BTreeNode()
+            self.root.children.append(old_root)
+            self._split_child(self.root, 0)
+
+        # Full children are split on the way down, so a leaf always has room.
+        node = self.root
+        while True:
+            keys = node.keys
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                node.values[i] = value
+                return
+            if not node.children:
+                keys.insert(i, key)
+                node.values.insert(i, value)
+                self.length += 1
+                return
+            if len(node.children[i].keys) == max_keys:
+                self._split_child(node, i)
+                if keys[i] == key:
+                    node.values[i] = value
+                    return
+                if keys[i] < key:
+                    i += 1
+            node = node.children[i]
+
+    # ----------------------------
+    # Deletion
+    # ----------------------------
+    def _merge_children(self, node, i):
+        """Merge node.children[i + 1] and the separating key into node.children[i]."""
+        left = node.children[i]
+        right = node.children.pop(i + 1)
+        left.keys.append(node.keys.pop(i))
+        left.values.append(node.values.pop(i))
+        left.keys.extend(right.keys)
+        left.values.extend(right.values)
+        left.children.extend(right.children)
+
+    def _fill_child(self, node, i):
+        """
+        Make sure node.children[i] has at least min_degree keys before
+        descending into it, by borrowing from a sibling or merging.
+        Returns the index of the child to descend into.
+        """
+        t = self.min_degree
+        children = node.children
+        if i > 0 and len(children[i - 1].keys) >= t:
+            # Rotate a key from the left sibling through the parent.
+            child, sibling = children[i], children[i - 1]
+            child.keys.insert(0, node.keys[i - 1])
+            child.values.insert(0, node.values[i - 1])
+            node.keys[i - 1] = sibling.keys.pop()
+            node.values[i - 1] = sibling.values.pop()
+            if sibling.children:
+                child.children.insert(0, sibling.children.pop())
+            return i
+        if i < len(children) - 1 and len(children[i + 1].keys) >= t:
+            # Rotate a key from the right sibling through the parent.
+            child, sibling = children[i], children[i + 1]
+            child.keys.append(node.keys[i])
+            child.values.append(node.values[i])
+            node.keys[i] = sibling.keys.pop(0)
+            node.values[i] = sibling.values.pop(0)
+            if sibling.children:
+                child.children.append(sibling.children.pop(0))
+            return i
+        if i < len(children) - 1:
+            self._merge_children(node, i)
+            return i
+        self._merge_children(node, i - 1)
+        return i - 1
+
+    def _delete(self, node, key):
+        """Delete key from the subtree rooted at node; returns its value."""
+        t = self.min_degree
+        while True:
+            keys = node.keys
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                if not node.children:
+                    del keys[i]
+                    return node.values.pop(i)
+
+                value = node.values[i]
+                left, right = node.children[i], node.children[i + 1]
+                if len(left.keys) >= t:
+                    # Replace with the predecessor, then delete it below.
+                    pred = left
+                    while pred.children:
+                        pred = pred.children[-1]
+                    keys[i], node.values[i] = pred.keys[-1], pred.values[-1]
+                    self._delete(left, keys[i])
+                elif len(right.keys) >= t:
+                    succ = right
+                    while succ.children:
+                        succ = succ.children[0]
+                    keys[i], node.values[i] = succ.keys[0], succ.values[0]
+                    self._delete(right, keys[i])
+                else:
+                    self._merge_children(node, i)
+                    self._delete(left, key)
+                return value
+
+            if not node.children:
+                raise KeyError(key)
+            if len(node.children[i].keys) < t:
+                i = self._fill_child(node, i)
+            node = node.children[i]
+
+    def delete(self, key):
+        """Remove key and return its value. Raises KeyError if key is absent."""
+        try:
+            value = self._delete(self.root, key)
+        finally:
+            # A merge may have emptied the root.
+            if not self.root.keys and self.root.children:
+                self.root = self.root.children[0]
+        self.length -= 1
+        return value
+
+    def pop_min(self):
+        """Remove and return the (key, value) pair with the smallest key."""
+        if self.length == 0:
+            raise KeyError("pop_min from empty map")
+        node = self.root
+        while node.children:
+            node = node.children[0]
+        key = node.keys[0]
+        return key, self.delete(key)
+
+    # ----------------------------
+    # Iteration
+    # ----------------------------
+    def items(self):
+        """Yield (key, value) pairs in ascending key order."""
+        return self._iter_node(self.root)
+
+    def _iter_node(self, node):
+        if not node.children:
+            yield from zip(node.keys, node.values)
+            return
+        for i, key in enumerate(node.keys):
+            yield from self._iter_node(node.children[i])
+            yield key, node.values[i]
+        yield from self._iter_node(node.children[-1])
+
+    def keys(self):
+        """Yield the keys in ascending order."""
+        for key, _ in self.items():
+            yield key
+
+    # ----------------------------
+    # Magic methods
+    # ----------------------------
+    def __len__(self):
+        return self.length
+
+    def __contains__(self, key):
+        sentinel = object()
+        return self.get(key, sentinel) is not sentinel
+
+    def __getitem__(self, key):
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __delitem__(self, key):
+        self.delete(key)
+
+    def __iter__(self):
+        return self.keys()
+
+    def __repr__(self):
+        return "BTreeMap({" + ", ".join(f"{k!r}: {v!r}" for k, v in self.items()) + "})"
+
+
+# ----------------------------
+# Benchmark
+# ----------------------------
+def benchmark(n=100_000, fanouts=(16, 64, 256), seed=0):
+    """
+    Time BSTMap against BTreeMap (one per fanout) on two workloads:
+    lookup-heavy (n inserts, then 5n lookups) and insert-heavy
+    (n inserts, then n deletes). Returns {backend: {workload: seconds}}.
+    """
+    rng = random.Random(seed)
+    keys = rng.sample(range(n * 10), n)
+    probes = [rng.choice(keys) for _ in range(5 * n)]
+
+    backends = {"BSTMap": BSTMap}
+    for fanout in fanouts:
+        backends[f"BTreeMap(fanout={fanout})"] = lambda f=fanout: BTreeMap(f)
+
+    results = {}
+    for name, make in backends.items():
+        m = make()
+        start = time.perf_counter()
+        for key in keys:
+            m.put(key, key)
+        insert_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for key in probes:
+            m.get(key)
+        lookup_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for key in keys:
+            m.delete(key)
+        delete_time = time.perf_counter() - start
+
+        results[name] = {
+            "lookup_heavy": insert_time + lookup_time,
+            "insert_heavy": insert_time + delete_time,
+        }
+    return results
+
+
+# ----------------------------
+# Example usage (for testing)
+# ----------------------------
+if __name__ == "__main__":
+    m = BTreeMap(fanout=4)
+    for k in [15, 12, 27, 7, 14, 20, 88, 23]:
+        m.put(k, str(k))
+    print(m)
+    print("get(20):", m.get(20))
+    print("floor(16):", m.floor(16), "ceiling(16):", m.ceiling(16))
+    print("pop_min:", m.pop_min())
+    print("delete(27):", m.delete(27))
+    print(m)
+
+    print("\nBenchmark (seconds):")
+    for name, times in benchmark(n=50_000).items():
+        print(f"{name:24} lookup-heavy {times['lookup_heavy']:.3f}  insert-heavy {times['insert_heavy']:.3f}")
@@ -0,0 +1,545 @@
+"""
+concurrent_queue.py
+--------------------
+Bounded FIFO queues for handing work between threads (BlockingQueue)
+and between asyncio tasks (AsyncQueue), built on the RingQueue ring
+buffer.
+
+Both queues apply backpressure: with a maxsize, put waits while the
+queue is full, and get waits while it is empty. Every wait can time out.
+get_many takes up to max_n items per wakeup, so a consumer that falls
+behind catches up in batches instead of waking once per item. Waiters
+are only notified when someone is actually waiting.
+
+Close/drain protocol:
+- close(): no more puts (put raises QueueClosed); waiters are woken
+- consumers keep getting the remaining items; once a closed queue is
+  empty, get raises QueueClosed and get_many returns []
+- wait_drained(): wait until consumers have taken every item
+- drain(): remove and return every remaining item at once
+
+Metrics (queue.metrics()) count puts, gets, waits, wakeups (including
+futile ones where the waiter found nothing to do), notifies (waiters
+signalled; a waiter that already has a pending signal is not signalled
+again), timeouts and, for BlockingQueue, how often the lock was contended.
+
+Features:
+- BlockingQueue: thread-safe put/put_many/get/get_many with timeouts
+- AsyncQueue: the same API as coroutines for a single event loop
+- Close/drain protocol and contention/wakeup metrics
+
+Author: Mohsin Jafari
+GitHub: https://github.com/mohsinjafari
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+
+from ring_queue import RingQueue
+
+
+class QueueClosed(Exception):
+    """Raised by put on a closed queue, and by get once a closed queue is empty."""
+
+
+class QueueMetrics:
+    """Counters describing how a queue has been used."""
+    __slots__ = (
+        "puts", "gets", "producer_waits", "consumer_waits", "wakeups",
+        "futile_wakeups", "notifies", "timeouts", "lock_acquires", "lock_contended",
+    )
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _deadline(timeout):
+    return None if timeout is None else time.monotonic() + timeout
+
+
+def _remaining(deadline):
+    return None if deadline is None else deadline - time.monotonic()
+
+
+# ========================================
+# Thread-safe blocking queue
+# ========================================
+class BlockingQueue:
+    """A bounded, thread-safe FIFO queue with blocking put and get."""
+    def __init__(self, maxsize=0):
+        """maxsize (int): Maximum number of items; 0 means unbounded."""
+        self.maxsize = maxsize
+        self.items = RingQueue()
+        self.closed = False
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+        self.empty = threading.Condition(self.lock)
+        # Waiting threads, and how many of them were signalled but have
+        # not woken up yet; only the difference is worth notifying. Every
+        # waiter that returns (notified or timed out) consumes one pending
+        # signal, so the count never exceeds the real number and no waiter
+        # is left without a wakeup; at worst a waiter is signalled twice.
+        self.waiting_getters = 0
+        self.waiting_putters = 0
+        self.signalled_getters = 0
+        self.signalled_putters = 0
+        self.stats = QueueMetrics()
+
+    # ----------------------------
+    # Locking helpers
+    # ----------------------------
+    def _acquire(self):
+        """Take the lock, counting the acquisitions that had to wait for it."""
+        contended = not self.lock.acquire(blocking=False)
+        if contended:
+            self.lock.acquire()
+            self.stats.lock_contended += 1
+        self.stats.lock_acquires += 1
+
+    def _wait(self, condition, deadline):
+        """
+        Wait on condition (lock held). Returns True if notified, False if
+        the deadline passed first.
+        """
+        remaining = _remaining(deadline)
+        if remaining is not None and remaining <= 0:
+            self.stats.timeouts += 1
+            return False
+        if not condition.wait(remaining):
+            self.stats.timeouts += 1
+            return False
+        self.stats.wakeups += 1
+        return True
+
+    def _wait_for_room(self, deadline):
+        """Wait until an item fits (lock held). Raises QueueClosed or TimeoutError."""
+        woken = timed_out = False
+        while True:
+            if self.closed:
+                raise QueueClosed("put on a closed queue")
+            if not self.maxsize or len(self.items) < self.maxsize:
+                return
+            if timed_out:
+                raise TimeoutError("put timed out")
+            if woken:
+                self.stats.futile_wakeups += 1
+            self.stats.producer_waits += 1
+            self.waiting_putters += 1
+            try:
+                woken = self._wait(self.not_full, deadline)
+            finally:
+                self.waiting_putters -= 1
+            if self.signalled_putters:
+                self.signalled_putters -= 1
+            timed_out = not woken
+
+    def _wait_for_items(self, deadline):
+        """
+        Wait until there is an item (lock held). Returns False on timeout.
+        Raises QueueClosed if the queue is closed and empty.
+        """
+        woken = timed_out = False
+        while True:
+            if len(self.items):
+                return True
+            if self.closed:
+                raise QueueClosed("get from a closed, empty queue")
+            if timed_out:
+                return False
+            if woken:
+                self.stats.futile_wakeups += 1
+            self.stats.consumer_waits += 1
+            self.waiting_getters += 1
+            try:
+                woken = self._wait(self.not_empty, deadline)
+            finally:
+                self.waiting_getters -= 1
+            if self.signalled_getters:
+                self.signalled_getters -= 1
+            timed_out = not woken
+
+    def _notify_getters(self, n):
+        """Signal up to n waiting consumers that have no signal pending."""
+        n = min(n, self.waiting_getters - self.signalled_getters)
+        if n > 0:
+            self.not_empty.notify(n)
+            self.signalled_getters += n
+            self.stats.notifies += n
+
+    def _notify_putters(self, n):
+        """Signal up to n waiting producers that have no signal pending."""
+        n = min(n, self.waiting_putters - self.signalled_putters)
+        if n > 0:
+            self.not_full.notify(n)
+            self.signalled_putters += n
+            self.stats.notifies += n
+        if not len(self.items):
+            self.empty.notify_all()
+
+    # ----------------------------
+    # Producers
+    # ----------------------------
+    def put(self, item, timeout=None):
+        """
+        Add an item, waiting up to timeout seconds (forever if None) while
+        the queue is full. Raises TimeoutError or QueueClosed.
+        """
+        deadline = _deadline(timeout)
+        self._acquire()
+        try:
+            self._wait_for_room(deadline)
+            self.items.enqueue(item)
+            self.stats.puts += 1
+            self._notify_getters(1)
+        finally:
+            self.lock.release()
+
+    def put_many(self, items, timeout=None):
+        """
+        Add every item of an iterable, writing as many as fit each time room
+        frees up. Raises TimeoutError (with the items not yet added left out)
+        or QueueClosed.
+        """
+        items = list(items)
+        deadline = _deadline(timeout)
+        start = 0
+        self._acquire()
+        try:
+            while start < len(items):
+                self._wait_for_room(deadline)
+                room = self.maxsize - len(self.items) if self.maxsize else len(items)
+                batch = items[start:start + room]
+                self.items.enqueue_many(batch)
+                start += len(batch)
+                self.stats.puts += len(batch)
+                self._notify_getters(len(batch))
+        finally:
+            self.lock.release()
+
+    # ----------------------------
+    # Consumers
+    # ----------------------------
+    def get(self, timeout=None):
+        """
+        Remove and return the oldest item, waiting up to timeout seconds
+        (forever if None) while the queue is empty. Raises TimeoutError, or
+        QueueClosed once a closed queue is empty.
+        """
+        deadline = _deadline(timeout)
+        self._acquire()
+        try:
+            if not self._wait_for_items(deadline):
+                raise TimeoutError("get timed out")
+            item = self.items.dequeue()
+            self.stats.gets += 1
+            self._notify_putters(1)
+            return item
+        finally:
+            self.lock.release()
+
+    def get_many(self, max_n, timeout=None):
+        """
+        Wait up to timeout seconds for at least one item, then remove and
+        return up to max_n oldest items in one go. Returns [] on timeout
+        or once a closed queue is empty.
+        """
+        deadline = _deadline(timeout)
+        self._acquire()
+        try:
+            try:
+                if not self._wait_for_items(deadline):
+                    return []
+            except QueueClosed:
+                return []
+            batch = self.items.dequeue_many(max_n)
+            self.stats.gets += len(batch)
+            self._notify_putters(len(batch))
+            return batch
+        finally:
+            self.lock.release()
+
+    # ----------------------------
+    # Close / drain
+    # ----------------------------
+    def close(self):
+        """Stop accepting items and wake every waiting producer and consumer."""
+        self._acquire()
+        try:
+            self.closed = True
+            self._notify_getters(self.waiting_getters)
+            self._notify_putters(self.waiting_putters)
+        finally:
+            self.lock.release()
+
+    def drain(self):
+        """Remove and return every remaining item, oldest first."""
+        self._acquire()
+        try:
+            batch = self.items.dequeue_many()
+            self.stats.gets += len(batch)
+            self._notify_putters(len(batch))
+            return batch
+        finally:
+            self.lock.release()
+
+    def wait_drained(self, timeout=None):
+        """Wait until the queue is empty. Returns False on timeout."""
+        deadline = _deadline(timeout)
+        self._acquire()
+        try:
+            while len(self.items):
+                if not self._wait(self.empty, deadline):
+                    return not len(self.items)
+            return True
+        finally:
+            self.lock.release()
+
+    def metrics(self):
+        """Return a snapshot of the queue's counters as a dict."""
+        with self.lock:
+            return self.stats.as_dict()
+
+    # ----------------------------
+    # Magic methods
+    # ----------------------------
+    def __len__(self):
+        return len(self.items)
+
+    def __repr__(self):
+        state = "closed" if self.closed else "open"
+        return f"BlockingQueue({len(self)} items, maxsize={self.maxsize}, {state})"
+
+
+# ========================================
+# asyncio queue
+# ========================================
+class AsyncQueue:
+    """
+    A bounded FIFO queue for asyncio tasks on one event loop. The loop
+    runs one task at a time, so no lock is needed and the lock counters
+    in metrics() stay 0; waiters park on futures instead.
+    """
+    def __init__(self, maxsize=0):
+        """maxsize (int): Maximum number of items; 0 means unbounded."""
+        self.maxsize = maxsize
+        self.items = RingQueue()
+        self.closed = False
+        self.getters = deque()
+        self.putters = deque()
+        self.drain_waiters = deque()
+        self.stats = QueueMetrics()
+
+    # ----------------------------
+    # Waiting helpers
+    # ----------------------------
+    async def _wait(self, waiters, deadline):
+        """Park on a new future in waiters. Returns False if the deadline passed."""
+        remaining = _remaining(deadline)
+        if remaining is not None and remaining <= 0:
+            self.stats.timeouts += 1
+            return False
+        future = asyncio.get_running_loop().create_future()
+        waiters.append(future)
+        try:
+            await asyncio.wait_for(future, remaining)
+        except asyncio.TimeoutError:
+            self.stats.timeouts += 1
+            return False
+        except asyncio.CancelledError:
+            # A wakeup meant for this task must not be lost: pass it on.
+            if future.done() and not future.cancelled():
+                self._wake(waiters, 1)
+            raise
+        finally:
+            if future in waiters:
+                waiters.remove(future)
+        self.stats.wakeups += 1
+        return True
+
+    def _wake(self, waiters, n):
+        """Resolve up to n pending futures of waiters."""
+        while n > 0 and waiters:
+            future = waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                self.stats.notifies += 1
+                n -= 1
+
+    def _after_get(self, n):
+        self.stats.gets += n
+        self._wake(self.putters, n)
+        if not len(self.items):
+            self._wake(self.drain_waiters, len(self.drain_waiters))
+
+    async def _wait_for_room(self, deadline):
+        waited = False
+        while True:
+            if self.closed:
+                raise QueueClosed("put on a closed queue")
+            if not self.maxsize or len(self.items) < self.maxsize:
+                return
+            if waited:
+                self.stats.futile_wakeups += 1
+            self.stats.producer_waits += 1
+            waited = await self._wait(self.putters, deadline)
+            if not waited:
+                raise TimeoutError("put timed out")
+
+    async def _wait_for_items(self, deadline):
+        waited = False
+        while True:
+            if len(self.items):
+                return True
+            if self.closed:
+                raise QueueClosed("get from a closed, empty queue")
+            if waited:
+                self.stats.futile_wakeups += 1
+            self.stats.consumer_waits += 1
+            waited = await self._wait(self.getters, deadline)
+            if not waited:
+                return False
+
+    # ----------------------------
+    # Producers
+    # ----------------------------
+    async def put(self, item, timeout=None):
+        """Add an item, waiting while the queue is full. Raises TimeoutError or QueueClosed."""
+        await self._wait_for_room(_deadline(timeout))
+        self.items.enqueue(item)
+        self.stats.puts += 1
+        self._wake(self.getters, 1)
+
+    async def put_many(self, items, timeout=None):
+        """Add every item of an iterable, writing as many as fit each time room frees up."""
+        items = list(items)
+        deadline = _deadline(timeout)
+        start = 0
+        while start < len(items):
+            await self._wait_for_room(deadline)
+            room = self.maxsize - len(self.items) if self.maxsize else len(items)
+            batch = items[start:start + room]
+            self.items.enqueue_many(batch)
+            start += len(batch)
+            self.stats.puts += len(batch)
+            self._wake(self.getters, len(batch))
+
+    # ----------------------------
+    # Consumers
+    # ----------------------------
+    async def get(self, timeout=None):
+        """
+        Remove and return the oldest item, waiting while the queue is empty.
+        Raises TimeoutError, or QueueClosed once a closed queue is empty.
+        """
+        if not await self._wait_for_items(_deadline(timeout)):
+            raise TimeoutError("get timed out")
+        item = self.items.dequeue()
+        self._after_get(1)
+        return item
+
+    async def get_many(self, max_n, timeout=None):
+        """
+        Wait for at least one item, then remove and return up to max_n
+        oldest items. Returns [] on timeout or once a closed queue is empty.
+        """
+        try:
+            if not await self._wait_for_items(_deadline(timeout)):
+                return []
+        except QueueClosed:
+            return []
+        batch = self.items.dequeue_many(max_n)
+        self._after_get(len(batch))
+        return batch
+
+    # ----------------------------
+    # Close / drain
+    # ----------------------------
+    def close(self):
+        """Stop accepting items and wake every waiting producer and consumer."""
+        self.closed = True
+        self._wake(self.getters, len(self.getters))
+        self._wake(self.putters, len(self.putters))
+
+    def drain(self):
+        """Remove and return every remaining item, oldest first."""
+        batch = self.items.dequeue_many()
+        self._after_get(len(batch))
+        return batch
+
+    async def wait_drained(self, timeout=None):
+        """Wait until the queue is empty. Returns False on timeout."""
+        deadline = _deadline(timeout)
+        while len(self.items):
+            if not await self._wait(self.drain_waiters, deadline):
+                return False
+        return True
+
+    def metrics(self):
+        """Return a snapshot of the queue's counters as a dict."""
+        return self.stats.as_dict()
+
+    # ----------------------------
+    # Magic methods
+    # ----------------------------
+    def __len__(self):
+        return len(self.items)
+
+    def __repr__(self):
+        state = "closed" if self.closed else "open"
+        return f"AsyncQueue({len(self)} items, maxsize={self.maxsize}, {state})"
+
+
+# ----------------------------
+# Example usage (for testing)
+# ----------------------------
+if __name__ == "__main__":
+    q = BlockingQueue(maxsize=64)
+    received = []
+
+    def consumer():
+        while True:
+            batch = q.get_many(16)
+            if not batch and q.closed:
+                return
+            received.extend(batch)
+
+    workers = [threading.Thread(target=consumer) for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    for i in range(0, 10_000, 100):
+        q.put_many(range(i, i + 100))
+    q.close()
+    q.wait_drained()
+    for worker in workers:
+        worker.join()
+    print("Threads received:", len(received), "items")
+    print("Thread metrics:", q.metrics())
+
+    async def main():
+        aq = AsyncQueue(maxsize=8)
+        got = []
+
+        async def produce():
+            for i in range(100):
+                await aq.put(i)
+            aq.close()
+
+        async def consume():
+            while True:
+                batch = await aq.get_many(4)
+                if not batch:
+                    return
+                got.extend(batch)
+
+        await asyncio.gather(produce(), consume())
+        print("Async received:", got == list(range(100)))
+        print("Async metrics:", aq.metrics())
+
+    asyncio.run(main())
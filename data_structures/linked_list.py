@@ -4,13 +4,15 @@ linked_list.py
 A simple and efficient implementation of a Singly Linked List in Python.
 
 Features:
-- Append (to right and left)
+- Append (to right and left), O(1) at both ends via a tail pointer
+- Extend from an iterable and build from an iterable in one pass
 - Insert at index
 - Pop by index
 - Reverse the list
 - Detect cycles (Floyd's algorithm and visited-set method)
 - Find value index
 - Clear and check empty
+- Slotted nodes and an optional NodePool that recycles popped nodes
 - Iterable, indexable, comparable
 - Convert to Python list
 
@@ -20,6 +22,8 @@ GitHub: https://github.com/mohsinjafari
 
 class Node:
     """A node in a singly linked list."""
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -28,9 +32,24 @@ class Node:
 
 class Linked_List:
     """Singly Linked List implementation."""
-    def __init__(self):
+    def __init__(self, pool=None):
+        """
+        pool (NodePool, optional): recycles nodes dropped by pop and clear.
+        A pooled list must not be modified while it is being iterated.
+        """
+        if pool is not None and not issubclass(pool.node_class, Node):
+            raise TypeError("pool must be a NodePool of this module's Node")
         self.head = None
+        self.tail = None
         self.length = 0
+        self.pool = pool
+
+    @classmethod
+    def from_iterable(cls, iterable, pool=None):
+        """Build a list holding the items of iterable, in order."""
+        ll = cls(pool)
+        ll.extend(iterable)
+        return ll
 
     # ----------------------------
     # Basic operations
@@ -38,9 +57,10 @@ class Linked_List:
 
     def append_left(self, data):
         """Add element to the beginning of the list."""
-        new_node = Node(data)
+        new_node = Node(data) if self.pool is None else self.pool.acquire(data)
         if self.head == None:
             self.head = new_node
+            self.tail = new_node
         else:
             new_node.next = self.head
             self.head = new_node
@@ -50,30 +70,47 @@ class Linked_List:
     
     def append(self, data):
         """Add element to the end of the list."""
-        new_node = Node(data)
+        new_node = Node(data) if self.pool is None else self.pool.acquire(data)
         if self.head == None:
             self.head = new_node
         else:
-            temp = self.head
-            while temp.next != None:
-                temp = temp.next
-            
-            temp.next = new_node
+            self.tail.next = new_node
+        self.tail = new_node
         self.length += 1
 
+    def extend(self, iterable):
+        """Add every element of iterable to the end of the list."""
+        tail = self.tail
+        pool = self.pool
+        count = 0
+        for data in iterable:
+            new_node = Node(data) if pool is None else pool.acquire(data)
+            if tail is None:
+                self.head = new_node
+            else:
+                tail.next = new_node
+            tail = new_node
+            count += 1
+        self.tail = tail
+        self.length += count
+
 
     
 
     def insert(self, index, data):
         """Insert element at a given index."""
 
-        if index < 0 or index >= self.length:
+        if index < 0 or index > self.length:
             raise IndexError()
         elif index == 0:
             self.append_left(data)
-        
+            return
+        elif index == self.length:
+            self.append(data)
+            return
+
         else:
-            new_node = Node(data)
+            new_node = Node(data) if self.pool is None else self.pool.acquire(data)
             f, s= self.head, self.head.next
             while index > 1:
                 f = s
@@ -90,8 +127,11 @@ class Linked_List:
             raise IndexError()
 
         elif index == 0:
-            val = self.head.data
-            self.head = self.head.next
+            s = self.head
+            val = s.data
+            self.head = s.next
+            if self.head is None:
+                self.tail = None
         
         else:
             f,s = self.head, self.head.next
@@ -102,7 +142,11 @@ class Linked_List:
             
             val = s.data
             f.next = s.next
+            if s is self.tail:
+                self.tail = f
         self.length-=1 
+        if self.pool is not None:
+            self.pool.release(s)
         return val
 
     def is_empty(self):
@@ -113,7 +157,10 @@ class Linked_List:
     
     def clear(self):
         """Remove all elements from the list."""
+        if self.pool is not None:
+            self.pool.release_chain(self.head)
         self.head = None
+        self.tail = None
         self.length = 0
 
 
@@ -140,6 +187,7 @@ class Linked_List:
         """Reverse the linked list."""
         prev = None
         current = self.head
+        self.tail = current
         while current:
             nxt = current.next
             current.next = prev
@@ -215,8 +263,7 @@ class Linked_List:
 # Example usage (for testing)
 # ----------------------------
 if __name__ == "__main__":
-    ll = Linked_List()
-    ll.append(10)
+    ll = Linked_List.from_iterable([10])
     ll.append(20)
     ll.append_left(5)
     ll.insert(2, 15)
@@ -225,4 +272,6 @@ if __name__ == "__main__":
     print("Index of 20:", ll.find(20))
     ll.reverse()
     print("Reversed:", ll)
+    ll.extend([1, 2, 3])
+    print("Extended:", ll)
     print("To list:", ll.to_list())
\ No newline at end of file
@@ -0,0 +1,203 @@
+"""
+node_pool.py
+----------------
+A free-list pool of linked-list nodes, shared by Stack, Queue and
+Linked_List, and a benchmark of slotted and pooled nodes.
+
+Released nodes are threaded through their own `next` field, so the pool
+itself allocates nothing. A container created with `pool=NodePool(Node)`
+takes nodes from the pool on push/enqueue/append and hands them back on
+pop/dequeue/clear, so a steady push/pop workload stops allocating.
+Several containers of the same node type can share one pool.
+
+A released node is reused by the next push, so a pooled container must
+not be mutated while it is being iterated: a live iterator may still
+hold a node that pop or clear has handed back to the pool.
+
+Pooling mainly saves memory churn, not time: CPython already keeps free
+lists for small objects, and the extra method calls can make pooled
+push/pop slower. Run benchmark() on the target machine before enabling it.
+
+Features:
+- NodePool: acquire, release, release_chain, bounded size, reuse counters
+- Benchmark: memory per container (dict vs slotted nodes) and push/pop
+  throughput (dict nodes, slotted nodes, slotted nodes with a pool)
+
+Author: Mohsin Jafari
+GitHub: https://github.com/mohsinjafari
+"""
+
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+DEFAULT_MAX_SIZE = 4096
+
+
+class NodePool:
+    """
+    A free list of nodes of one class. Nodes must have `data` and `next`
+    fields; any other links (such as `prev`) are reset by the container
+    before it releases a node. Only instances of node_class are accepted.
+    """
+    __slots__ = ("node_class", "max_size", "free", "size", "created", "reused")
+
+    def __init__(self, node_class, max_size=DEFAULT_MAX_SIZE):
+        self.node_class = node_class
+        self.max_size = max_size
+        self.free = None
+        self.size = 0
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, data):
+        """Return a node holding data, reusing a released node when possible."""
+        node = self.free
+        if node is None:
+            self.created += 1
+            return self.node_class(data)
+        if not isinstance(node, self.node_class):
+            raise TypeError(f"pooled node is a {type(node).__name__}, "
+                            f"not a {self.node_class.__name__}")
+        self.free = node.next
+        self.size -= 1
+        self.reused += 1
+        node.data = data
+        node.next = None
+        return node
+
+    def release(self, node):
+        """Return a node to the pool. It is dropped if the pool is full."""
+        if not isinstance(node, self.node_class):
+            raise TypeError(f"cannot release a {type(node).__name__} into a "
+                            f"pool of {self.node_class.__name__}")
+        if self.size < self.max_size:
+            node.data = None
+            node.next = self.free
+            self.free = node
+            self.size += 1
+
+    def release_chain(self, head):
+        """Release every node of the chain starting at head, until the pool is full."""
+        while head is not None and self.size < self.max_size:
+            nxt = head.next
+            self.release(head)
+            head = nxt
+
+    def clear(self):
+        """Drop all pooled nodes."""
+        self.free = None
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return (f"NodePool({self.node_class.__name__}, {self.size} free, "
+                f"{self.created} created, {self.reused} reused)")
+
+
+# ----------------------------
+# Benchmark
+# ----------------------------
+@contextmanager
+def _dict_nodes(module):
+    """Temporarily swap module.Node for an equivalent class with a __dict__."""
+    slotted = module.Node
+    module.Node = type("Node", (slotted,), {})
+    try:
+        yield
+    finally:
+        module.Node = slotted
+
+
+def _containers():
+    """name -> (module, container class, push method name, pop callable)."""
+    import Queue
+    import linked_list
+    import stack
+    return {
+        "Stack": (stack, stack.Stack, "push", lambda c: c.pop()),
+        "Queue": (Queue, Queue.Queue, "enqueue", lambda c: c.dequeue()),
+        "Linked_List": (linked_list, linked_list.Linked_List, "append_left",
+                        lambda c: c.pop(0)),
+    }
+
+
+def _fill_memory(cls, push_name, n):
+    """Bytes allocated to build a container of n small ints."""
+    tracemalloc.start()
+    container = cls()
+    push = getattr(container, push_name)
+    for i in range(n):
+        push(i & 255)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return memory
+
+
+def _push_pop_rate(container, push_name, pop, batch, rounds):
+    """Push/pop operations per second over rounds of batch pushes then pops."""
+    push = getattr(container, push_name)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for i in range(batch):
+            push(i)
+        for _ in range(batch):
+            pop(container)
+    return 2 * batch * rounds / (time.perf_counter() - start)
+
+
+def benchmark(n=100_000, batch=64, rounds=2000, repeat=3):
+    """
+    For each of Stack, Queue and Linked_List, measures the bytes used by a
+    container of n items with dict-based nodes (the old layout) and with
+    slotted nodes, and the push/pop throughput (ops per second, best of
+    repeat runs) of batch pushes followed by batch pops, repeated rounds
+    times, for dict nodes, slotted nodes, and slotted nodes drawn from a
+    NodePool. Throughput differences are small and machine dependent;
+    only the memory saving of slotted nodes is consistent.
+    """
+    results = {}
+    for name, (module, cls, push_name, pop) in _containers().items():
+        with _dict_nodes(module):
+            dict_bytes = _fill_memory(cls, push_name, n)
+            dict_rate = max(_push_pop_rate(cls(), push_name, pop, batch, rounds)
+                            for _ in range(repeat))
+        slotted_bytes = _fill_memory(cls, push_name, n)
+        slotted_rate = max(_push_pop_rate(cls(), push_name, pop, batch, rounds)
+                           for _ in range(repeat))
+        pooled_rate = max(_push_pop_rate(cls(pool=NodePool(module.Node)),
+                                         push_name, pop, batch, rounds)
+                          for _ in range(repeat))
+        results[name] = {
+            "dict_bytes": dict_bytes,
+            "slotted_bytes": slotted_bytes,
+            "dict_ops_per_sec": dict_rate,
+            "slotted_ops_per_sec": slotted_rate,
+            "pooled_ops_per_sec": pooled_rate,
+        }
+    return results
+
+
+# ----------------------------
+# Example usage (for testing)
+# ----------------------------
+if __name__ == "__main__":
+    from stack import Node, Stack
+
+    pool = NodePool(Node)
+    s = Stack(pool=pool)
+    for value in (10, 20, 30):
+        s.push(value)
+    print(s.pop(), s.pop())  # 30 20
+    s.push(40)               # reuses a popped node
+    print(s, pool)
+
+    for name, r in benchmark().items():
+        print(
+            f"{name}: {r['dict_bytes']:,} -> {r['slotted_bytes']:,} bytes; "
+            f"push/pop {r['dict_ops_per_sec']:,.0f} (dict), "
+            f"{r['slotted_ops_per_sec']:,.0f} (slotted), "
+            f"{r['pooled_ops_per_sec']:,.0f} (pooled) ops/s"
+        )
@@ -0,0 +1,294 @@
+"""
+ring_queue.py
+----------------
+A Queue (FIFO) backed by a circular array (ring buffer) in Python.
+
+Items live in one Python list used as a ring: `head` is the slot of the
+oldest item and new items are written `length` slots after it, wrapping
+around. No object is allocated per item, and batches are moved with at
+most two slice copies. The API matches Queue.Queue (enqueue, dequeue,
+is_empty, __len__, __iter__ from newest to oldest), so it is a drop-in
+replacement.
+
+Without a capacity the ring doubles when full. With a fixed capacity,
+the overflow policy decides what a full queue does:
+- "reject": raise OverflowError
+- "overwrite": drop the oldest items to make room
+- "block": wait until another thread dequeues (optionally with a timeout)
+
+Features:
+- enqueue, dequeue, is_empty, clear, iteration, len
+- enqueue_many / dequeue_many moving whole slices
+- Growable or fixed capacity with reject / overwrite / block policies
+- Benchmark against the linked-list Queue
+
+Author: Mohsin Jafari
+GitHub: https://github.com/mohsinjafari
+"""
+
+import threading
+import time
+
+from Queue import Queue
+
+DEFAULT_SIZE = 16
+OVERFLOW_POLICIES = ("reject", "overwrite", "block")
+
+
+class RingQueue:
+    """A Queue data structure implemented using a circular array."""
+    def __init__(self, capacity=None, overflow="reject"):
+        """
+        Parameters:
+        capacity (int, optional): Maximum number of items. None means the
+            ring grows as needed.
+        overflow (str): What a full fixed-capacity queue does on enqueue:
+            "reject", "overwrite" or "block".
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}")
+        self.capacity = capacity
+        self.overflow = overflow
+        self.buffer = [None] * (capacity or DEFAULT_SIZE)
+        self.head = 0
+        self.length = 0
+        self.dropped = 0  # items discarded by the "overwrite" policy
+        # Producers wait on this condition under the "block" policy.
+        self.not_full = threading.Condition() if capacity and overflow == "block" else None
+
+    # ----------------------------
+    # Ring helpers (no locking)
+    # ----------------------------
+    def _grow(self, min_size):
+        """Copy the items, oldest first, into a larger ring."""
+        items = self._ordered()
+        size = max(2 * len(self.buffer), min_size)
+        self.buffer = items + [None] * (size - len(items))
+        self.head = 0
+
+    def _ordered(self):
+        """Return the items oldest first."""
+        buffer, head, n = self.buffer, self.head, self.length
+        end = head + n
+        if end <= len(buffer):
+            return buffer[head:end]
+        return buffer[head:] + buffer[:end - len(buffer)]
+
+    def _write(self, items):
+        """Append items after the newest item; the caller ensures they fit."""
+        buffer = self.buffer
+        size = len(buffer)
+        n = len(items)
+        tail = (self.head + self.length) % size
+        first = min(n, size - tail)
+        buffer[tail:tail + first] = items[:first]
+        if first < n:
+            buffer[:n - first] = items[first:]
+        self.length += n
+
+    def _drop_oldest(self, n):
+        """Discard the n oldest items (overwrite policy)."""
+        self._take(n)
+        self.dropped += n
+
+    def _take(self, n):
+        """Remove and return the n oldest items, clearing their slots."""
+        buffer = self.buffer
+        size = len(buffer)
+        head = self.head
+        first = min(n, size - head)
+        items = buffer[head:head + first]
+        buffer[head:head + first] = [None] * first
+        if first < n:
+            rest = n - first
+            items += buffer[:rest]
+            buffer[:rest] = [None] * rest
+        self.head = (head + n) % size
+        self.length -= n
+        return items
+
+    def _wait_for_room(self, deadline):
+        """Block until the ring has a free slot; the caller holds not_full."""
+        while self.length == len(self.buffer):
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise OverflowError("queue is full (timed out)")
+            self.not_full.wait(remaining)
+
+    # ----------------------------
+    # Basic operations
+    # ----------------------------
+    def enqueue(self, data, timeout=None):
+        """
+        Add an item at the back of the queue. timeout (seconds) only
+        applies to the "block" policy.
+        """
+        if self.not_full is not None:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            with self.not_full:
+                self._wait_for_room(deadline)
+                self._write([data])
+            return
+
+        if self.length == len(self.buffer):
+            if self.capacity is None:
+                self._grow(self.length + 1)
+            elif self.overflow == "reject":
+                raise OverflowError("queue is full")
+            else:
+                self._drop_oldest(1)
+        self.buffer[(self.head + self.length) % len(self.buffer)] = data
+        self.length += 1
+
+    def enqueue_many(self, items, timeout=None):
+        """
+        Add every item of an iterable at the back of the queue, copying
+        them in at most two slices. Under the "reject" policy the batch is
+        all-or-nothing; under "overwrite" the oldest items are dropped;
+        under "block" the batch is written as room becomes available.
+
+        A "block" batch can be partly written when timeout expires: the
+        OverflowError raised then has a `written` attribute holding the
+        number of leading items already enqueued, so the caller can retry
+        with items[written:].
+        """
+        items = list(items)
+        n = len(items)
+        if self.not_full is not None:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            start = 0
+            while start < n:
+                with self.not_full:
+                    try:
+                        self._wait_for_room(deadline)
+                    except OverflowError as exc:
+                        exc.written = start
+                        raise
+                    count = min(n - start, len(self.buffer) - self.length)
+                    self._write(items[start:start + count])
+                start += count
+            return
+
+        free = len(self.buffer) - self.length
+        if n > free:
+            if self.capacity is None:
+                self._grow(self.length + n)
+            elif self.overflow == "reject":
+                raise OverflowError(f"queue is full ({free} free slots, {n} items)")
+            else:
+                if n > self.capacity:
+                    self.dropped += n - self.capacity
+                    items = items[n - self.capacity:]
+                    n = self.capacity
+                self._drop_oldest(min(self.length, n - free))
+        self._write(items)
+
+    def dequeue(self):
+        """Remove and return the oldest item. Returns None if the queue is empty."""
+        if self.not_full is not None:
+            with self.not_full:
+                if self.length == 0:
+                    return None
+                val = self._take(1)[0]
+                self.not_full.notify()
+            return val
+
+        if self.length == 0:
+            return None
+        buffer = self.buffer
+        val = buffer[self.head]
+        buffer[self.head] = None
+        self.head = (self.head + 1) % len(buffer)
+        self.length -= 1
+        return val
+
+    def dequeue_many(self, max_n=None):
+        """Remove and return up to max_n oldest items (all by default), oldest first."""
+        if self.not_full is not None:
+            with self.not_full:
+                n = self.length if max_n is None else min(max_n, self.length)
+                items = self._take(n)
+                self.not_full.notify(n)
+            return items
+
+        n = self.length if max_n is None else min(max_n, self.length)
+        return self._take(n)
+
+    def is_empty(self):
+        return self.length == 0
+
+    def clear(self):
+        """Remove all items."""
+        self.dequeue_many()
+
+    # ----------------------------
+    # Magic methods
+    # ----------------------------
+    def __iter__(self):
+        # Newest to oldest, like Queue.
+        return reversed(self._ordered())
+
+    def __len__(self):
+        return self.length
+
+    def __repr__(self):
+        return "RingQueue(" + ", ".join(repr(item) for item in self) + ")"
+
+
+# ----------------------------
+# Benchmark
+# ----------------------------
+def benchmark(n=200_000, batch=256):
+    """
+    Moves n items through a Queue and a RingQueue, one at a time and in
+    batches of `batch`, and returns the seconds each took.
+    """
+    values = list(range(n))
+    results = {}
+
+    q = Queue()
+    start = time.perf_counter()
+    for v in values:
+        q.enqueue(v)
+    while not q.is_empty():
+        q.dequeue()
+    results["Queue"] = time.perf_counter() - start
+
+    r = RingQueue()
+    start = time.perf_counter()
+    for v in values:
+        r.enqueue(v)
+    while not r.is_empty():
+        r.dequeue()
+    results["RingQueue"] = time.perf_counter() - start
+
+    r = RingQueue(capacity=4 * batch)
+    start = time.perf_counter()
+    for i in range(0, n, batch):
+        r.enqueue_many(values[i:i + batch])
+        r.dequeue_many(batch)
+    results["RingQueue batched"] = time.perf_counter() - start
+    return results
+
+
+"Testing the RingQueue implementation"
+
+if __name__ == "__main__":
+    q = RingQueue()
+    q.enqueue(1)
+    q.enqueue(2)
+    q.enqueue(3)
+    print(q)  # RingQueue(3, 2, 1)
+    print(q.dequeue())  # 1
+    q.enqueue_many([4, 5, 6])
+    print(q.dequeue_many(3))  # [2, 3, 4]
+    print(len(q))  # 2
+
+    ring = RingQueue(capacity=3, overflow="overwrite")
+    ring.enqueue_many([1, 2, 3, 4, 5])
+    print(ring.dequeue_many(), "dropped:", ring.dropped)  # [3, 4, 5] dropped: 2
+
+    for name, seconds in benchmark().items():
+        print(f"{name}: {seconds:.3f}s")
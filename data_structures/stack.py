@@ -10,6 +10,7 @@ Features:
 - is_empty: check if stack is empty
 - size: return number of elements
 - clear: remove all elements
+- Slotted nodes and an optional NodePool that recycles popped nodes
 - __iter__, __len__, and __repr__ support
 
 Author: Mohsin Jafari
@@ -18,6 +19,8 @@ GitHub: https://github.com/mohsinjafari
 
 class Node:
     """A node in a stack."""
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -27,9 +30,16 @@ class Stack:
 
 
 
-    def __init__(self):
+    def __init__(self, pool=None):
+        """
+        pool (NodePool, optional): recycles nodes dropped by pop and clear.
+        A pooled stack must not be modified while it is being iterated.
+        """
+        if pool is not None and not issubclass(pool.node_class, Node):
+            raise TypeError("pool must be a NodePool of this module's Node")
         self.head = None
         self.length = 0
+        self.pool = pool
 
 
     # ----------------------------
@@ -37,7 +47,7 @@ class Stack:
     # ----------------------------
     def push(self, data):
         """Add element to the top of the stack."""
-        new_node = Node(data)
+        new_node = Node(data) if self.pool is None else self.pool.acquire(data)
         if self.head is None:
             self.head = new_node    
         else:
@@ -51,9 +61,12 @@ class Stack:
         """Remove and return the top item from the stack. Returns None if stack is empty."""
         if self.head == None:
             return None
-        val = self.head.data
-        self.head = self.head.next  
+        node = self.head
+        val = node.data
+        self.head = node.next
         self.length -= 1
+        if self.pool is not None:
+            self.pool.release(node)
         return val
     
 
@@ -70,6 +83,8 @@ class Stack:
 
     def clear(self):
         """Remove all items from the stack."""
+        if self.pool is not None:
+            self.pool.release_chain(self.head)
         self.head = None
         self.length = 0
 
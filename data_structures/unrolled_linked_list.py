@@ -0,0 +1,312 @@
+"""
+unrolled_linked_list.py
+------------------------
+An Unrolled (chunked) Singly Linked List in Python.
+
+Each node holds a small list of up to `capacity` values instead of a
+single value. Walking the list hops once per chunk rather than once per
+element, and the per-node overhead is shared by a whole chunk, so the
+list is much smaller and faster to scan than Linked_List. Chunks split
+in half when an insert overflows them and merge with their neighbour
+when a removal leaves them less than half full.
+
+Features:
+- Same API as Linked_List: append, append_left, insert, pop, find,
+  reverse, extend, from_iterable, clear, is_empty, to_list
+- Iterable, sized, comparable
+- Benchmark against Linked_List (memory, build, iterate, find)
+
+Author: Mohsin Jafari
+GitHub: https://github.com/mohsinjafari
+"""
+
+import time
+import tracemalloc
+
+from linked_list import Linked_List
+
+DEFAULT_CAPACITY = 64
+
+
+class Chunk:
+    """A node of an unrolled linked list, holding up to capacity values."""
+    __slots__ = ("items", "next")
+
+    def __init__(self, items=None):
+        self.items = items if items is not None else []
+        self.next = None
+
+
+class Unrolled_Linked_List:
+    """Unrolled Singly Linked List implementation."""
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.capacity = capacity
+        self.head = None
+        self.tail = None
+        self.length = 0
+
+    @classmethod
+    def from_iterable(cls, iterable, capacity=DEFAULT_CAPACITY):
+        """Build a list holding the items of iterable, in order."""
+        ull = cls(capacity)
+        ull.extend(iterable)
+        return ull
+
+    # ----------------------------
+    # Internal helpers
+    # ----------------------------
+
+    def _locate(self, index):
+        """
+        Return (prev, chunk, offset) for a valid position index, where prev
+        is the chunk before chunk (None for the head chunk).
+        """
+        prev, chunk = None, self.head
+        while index >= len(chunk.items):
+            index -= len(chunk.items)
+            prev, chunk = chunk, chunk.next
+        return prev, chunk, index
+
+    def _split(self, chunk):
+        """Move the upper half of a full chunk into a new chunk after it."""
+        half = len(chunk.items) // 2
+        new_chunk = Chunk(chunk.items[half:])
+        del chunk.items[half:]
+        new_chunk.next = chunk.next
+        chunk.next = new_chunk
+        if chunk is self.tail:
+            self.tail = new_chunk
+
+    def _unlink(self, prev, chunk):
+        """Remove an empty chunk from the chain."""
+        if prev is None:
+            self.head = chunk.next
+        else:
+            prev.next = chunk.next
+        if chunk is self.tail:
+            self.tail = prev
+
+    # ----------------------------
+    # Basic operations
+    # ----------------------------
+
+    def append_left(self, data):
+        """Add element to the beginning of the list."""
+        if self.head is None or len(self.head.items) >= self.capacity:
+            new_chunk = Chunk([data])
+            new_chunk.next = self.head
+            self.head = new_chunk
+            if self.tail is None:
+                self.tail = new_chunk
+        else:
+            self.head.items.insert(0, data)
+        self.length += 1
+
+    def append(self, data):
+        """Add element to the end of the list."""
+        if self.tail is None:
+            self.head = self.tail = Chunk([data])
+        elif len(self.tail.items) >= self.capacity:
+            new_chunk = Chunk([data])
+            self.tail.next = new_chunk
+            self.tail = new_chunk
+        else:
+            self.tail.items.append(data)
+        self.length += 1
+
+    def extend(self, iterable):
+        """Add every element of iterable to the end of the list, filling whole chunks."""
+        capacity = self.capacity
+        tail = self.tail
+        count = 0
+        for data in iterable:
+            if tail is None:
+                tail = self.head = Chunk([data])
+            elif len(tail.items) >= capacity:
+                tail.next = Chunk([data])
+                tail = tail.next
+            else:
+                tail.items.append(data)
+            count += 1
+        self.tail = tail
+        self.length += count
+
+    def insert(self, index, data):
+        """Insert element at a given index."""
+        if index < 0 or index > self.length:
+            raise IndexError()
+        elif index == self.length:
+            self.append(data)
+            return
+
+        _, chunk, offset = self._locate(index)
+        if len(chunk.items) >= self.capacity:
+            self._split(chunk)
+            if offset > len(chunk.items):
+                offset -= len(chunk.items)
+                chunk = chunk.next
+        chunk.items.insert(offset, data)
+        self.length += 1
+
+    def pop(self, index):
+        """Remove and return element at given index."""
+        if index < 0 or index >= self.length:
+            raise IndexError()
+
+        prev, chunk, offset = self._locate(index)
+        val = chunk.items.pop(offset)
+        self.length -= 1
+
+        if not chunk.items:
+            self._unlink(prev, chunk)
+        elif len(chunk.items) < self.capacity // 2:
+            # Merge an underfull chunk with the next one when both fit.
+            nxt = chunk.next
+            if nxt is not None and len(chunk.items) + len(nxt.items) <= self.capacity:
+                chunk.items.extend(nxt.items)
+                chunk.next = nxt.next
+                if nxt is self.tail:
+                    self.tail = chunk
+        return val
+
+    def is_empty(self):
+        """Check if list is empty."""
+        return self.length == 0
+
+    def clear(self):
+        """Remove all elements from the list."""
+        self.head = None
+        self.tail = None
+        self.length = 0
+
+    # ----------------------------
+    # Utility methods
+    # ----------------------------
+
+    def find(self, value):
+        """Return index of first occurrence of value, or -1 if not found."""
+        chunk = self.head
+        base = 0
+        while chunk:
+            if value in chunk.items:
+                return base + chunk.items.index(value)
+            base += len(chunk.items)
+            chunk = chunk.next
+        return -1
+
+    def reverse(self):
+        """Reverse the list: reverse the chunk chain and each chunk's items."""
+        prev = None
+        current = self.head
+        self.tail = current
+        while current:
+            current.items.reverse()
+            nxt = current.next
+            current.next = prev
+            prev = current
+            current = nxt
+        self.head = prev
+
+    def to_list(self):
+        """Convert the list to a Python list."""
+        result = []
+        chunk = self.head
+        while chunk:
+            result.extend(chunk.items)
+            chunk = chunk.next
+        return result
+
+    # ----------------------------
+    # Magic methods
+    # ----------------------------
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        chunk = self.head
+        while chunk:
+            yield from chunk.items
+            chunk = chunk.next
+
+    def __eq__(self, other):
+        if not isinstance(other, (Unrolled_Linked_List, Linked_List)):
+            return False
+        if len(self) != len(other):
+            return False
+        return all(a == b for a, b in zip(self, other))
+
+    def __repr__(self):
+        return "Unrolled_Linked_List([" + " -> ".join(str(v) for v in self) + "])"
+
+
+# ----------------------------
+# Benchmark
+# ----------------------------
+def benchmark(n, capacity=DEFAULT_CAPACITY):
+    """
+    Builds a list of n integers with Linked_List and with
+    Unrolled_Linked_List and returns, for each, the bytes allocated
+    (tracemalloc) and the seconds taken to build it, iterate over it,
+    convert it with to_list and find its last value.
+    """
+    values = range(1_000_000, 1_000_000 + n)
+    builders = (
+        ("Linked_List", Linked_List.from_iterable),
+        ("Unrolled_Linked_List", lambda it: Unrolled_Linked_List.from_iterable(it, capacity)),
+    )
+    results = {}
+    for name, build in builders:
+        tracemalloc.start()
+        lst = build(values)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        lst = build(values)
+        built = time.perf_counter()
+        for _ in lst:
+            pass
+        iterated = time.perf_counter()
+        lst.to_list()
+        converted = time.perf_counter()
+        lst.find(values[-1])
+        found = time.perf_counter()
+
+        results[name] = {
+            "bytes": memory,
+            "build": built - start,
+            "iterate": iterated - built,
+            "to_list": converted - iterated,
+            "find": found - converted,
+        }
+        del lst
+    return results
+
+
+# ----------------------------
+# Example usage (for testing)
+# ----------------------------
+if __name__ == "__main__":
+    ull = Unrolled_Linked_List(capacity=4)
+    ull.extend([10, 20, 30, 40, 50])
+    ull.append_left(5)
+    ull.insert(2, 15)
+    print(ull)
+    print("List length:", len(ull))
+    print("Index of 40:", ull.find(40))
+    print("Pop index 3:", ull.pop(3))
+    ull.reverse()
+    print("Reversed:", ull)
+    print("To list:", ull.to_list())
+
+    n = 200_000
+    result = benchmark(n)
+    for name, stats in result.items():
+        print(
+            f"n={n} {name}: {stats['bytes']:,} bytes, build {stats['build']:.3f}s, "
+            f"iterate {stats['iterate']:.3f}s, to_list {stats['to_list']:.3f}s, "
+            f"find {stats['find']:.3f}s"
+        )
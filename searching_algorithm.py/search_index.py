@@ -0,0 +1,225 @@
+"""
+search_index.py
+------------------------
+A build-once, read-many search index over a sorted array.
+
+The values are re-laid out in Eytzinger (BFS) order: the root of the
+implicit binary search tree is stored first, then its two children,
+then the four grandchildren, and so on. The first levels of every
+search touch the same few cells, and each step moves to index 2k or
+2k + 1, so lookups stay cache-friendly on large arrays. Integer and
+float keys are packed into a compact array.array.
+
+In pure Python the memory layout cannot pay for the interpreter work
+per level: a single lookup is about 2x slower than bisect.bisect_left,
+which runs in C. The index wins on batches of queries with NumPy, where
+all targets descend the tree together; benchmark() measures both.
+
+Features:
+- contains, rank and lower_bound queries
+- Batched queries (vectorized with NumPy when available)
+- Benchmark against bisect and numpy.searchsorted
+
+Author: Mohsin Jafari
+GitHub: https://github.com/mohsinjafari
+"""
+
+import random
+import time
+from array import array
+from bisect import bisect_left
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; pure-Python paths are used without it
+    np = None
+
+
+def _compact(values):
+    """Return values packed into an array.array when they are all ints or floats."""
+    try:
+        return array("q", values)
+    except (TypeError, OverflowError):
+        pass
+    if all(type(value) is float for value in values):
+        return array("d", values)
+    return list(values)
+
+
+class EytzingerIndex:
+    """
+    A static search index over a sorted sequence, stored in Eytzinger order.
+    Slot 0 is unused so that the children of slot k are 2k and 2k + 1.
+    """
+
+    def __init__(self, sorted_values):
+        values = list(sorted_values)
+        n = len(values)
+        self.length = n
+
+        # Fill the tree slots in in-order, which visits them in sorted order.
+        layout = [values[0] if n else None] * (n + 1)
+        ranks = array("q", bytes(8 * (n + 1)))
+        stack, k, i = [], 1, 0
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k = 2 * k
+            k = stack.pop()
+            layout[k] = values[i]
+            ranks[k] = i
+            i += 1
+            k = 2 * k + 1
+
+        self.tree = _compact(layout)
+        self.ranks = ranks  # ranks[k]: position of tree[k] in sorted order
+
+    # ----------------------------
+    # Single queries
+    # ----------------------------
+    def _lower_bound_slot(self, target):
+        """
+        Return the slot of the first value not less than target,
+        or 0 when every value is less than target.
+        """
+        tree, n = self.tree, self.length
+        k = 1
+        while k <= n:
+            k = 2 * k + (tree[k] < target)
+        # Undo the trailing right turns (1 bits) and the last left turn.
+        return k >> ((~k & (k + 1)).bit_length())
+
+    def lower_bound(self, target):
+        """
+        Return the position in sorted order of the first value not less
+        than target (len(self) if there is none).
+        """
+        k = self._lower_bound_slot(target)
+        return self.ranks[k] if k else self.length
+
+    def rank(self, target):
+        """Return the number of values strictly less than target."""
+        return self.lower_bound(target)
+
+    def contains(self, target):
+        """Return True if target is in the index."""
+        k = self._lower_bound_slot(target)
+        return k != 0 and self.tree[k] == target
+
+    # ----------------------------
+    # Batched queries
+    # ----------------------------
+    def lower_bound_many(self, targets):
+        """Return lower_bound for each target (a NumPy array for NumPy input)."""
+        if np is not None and isinstance(targets, np.ndarray):
+            k = self._numpy_slots(targets)
+            ranks = np.frombuffer(self.ranks, dtype=np.int64)
+            return np.where(k > 0, ranks[k], self.length)
+
+        slot, ranks, n = self._lower_bound_slot, self.ranks, self.length
+        result = []
+        for target in targets:
+            k = slot(target)
+            result.append(ranks[k] if k else n)
+        return result
+
+    def contains_many(self, targets):
+        """Return contains for each target (a NumPy array for NumPy input)."""
+        if np is not None and isinstance(targets, np.ndarray):
+            k = self._numpy_slots(targets)
+            tree = np.asarray(self.tree)
+            return (k > 0) & (tree[k] == targets)
+
+        slot, tree = self._lower_bound_slot, self.tree
+        result = []
+        for target in targets:
+            k = slot(target)
+            result.append(k != 0 and tree[k] == target)
+        return result
+
+    def _numpy_slots(self, targets):
+        """Vectorized _lower_bound_slot: descend all targets level by level."""
+        tree = np.asarray(self.tree)
+        n = self.length
+        k = np.ones(len(targets), dtype=np.int64)
+        for _ in range(n.bit_length()):
+            active = k <= n
+            step = np.zeros(len(targets), dtype=np.int64)
+            step[active] = tree[k[active]] < targets[active]
+            k = np.where(active, 2 * k + step, k)
+        # Undo the trailing right turns (1 bits) and the last left turn.
+        ones = (k & 1) == 1
+        while ones.any():
+            k = np.where(ones, k >> 1, k)
+            ones = (k & 1) == 1
+        return k >> 1
+
+    # ----------------------------
+    # Magic methods
+    # ----------------------------
+    def __len__(self):
+        return self.length
+
+    def __contains__(self, target):
+        return self.contains(target)
+
+    def __repr__(self):
+        return f"EytzingerIndex({len(self)} values)"
+
+
+# ----------------------------
+# Benchmark
+# ----------------------------
+def benchmark(n=1_000_000, queries=200_000, seed=0):
+    """
+    Time lower_bound queries over n sorted integers and return the seconds
+    taken by: bisect_left per query, EytzingerIndex.lower_bound per query,
+    and, when NumPy is available, EytzingerIndex.lower_bound_many and
+    numpy.searchsorted on the whole batch.
+    """
+    rng = random.Random(seed)
+    values = list(range(0, 2 * n, 2))
+    targets = [rng.randrange(2 * n) for _ in range(queries)]
+    index = EytzingerIndex(values)
+    results = {}
+
+    start = time.perf_counter()
+    for target in targets:
+        bisect_left(values, target)
+    results["bisect_left"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for target in targets:
+        index.lower_bound(target)
+    results["EytzingerIndex.lower_bound"] = time.perf_counter() - start
+
+    if np is not None:
+        batch = np.array(targets)
+        sorted_array = np.array(values)
+        start = time.perf_counter()
+        index.lower_bound_many(batch)
+        results["EytzingerIndex.lower_bound_many"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        np.searchsorted(sorted_array, batch)
+        results["numpy.searchsorted"] = time.perf_counter() - start
+    return results
+
+
+# ----------------------------
+# Example Usage
+# ----------------------------
+if __name__ == "__main__":
+    arr = [1, 3, 5, 7, 9, 11]
+    index = EytzingerIndex(arr)
+
+    print("Sorted array:", arr)
+    print("Eytzinger layout:", list(index.tree)[1:])
+    print("Contains 7:", index.contains(7))
+    print("Contains 4:", index.contains(4))
+    print("Rank of 8:", index.rank(8))
+    print("Lower bound of 9:", index.lower_bound(9))
+    print("Batched contains [1, 4, 11]:", index.contains_many([1, 4, 11]))
+
+    for name, seconds in benchmark().items():
+        print(f"{name}: {seconds:.3f}s")
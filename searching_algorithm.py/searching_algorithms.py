@@ -2,19 +2,35 @@
 searching_algorithms.py
 ------------------------
 Implement common search algorithms in Python including:
-- Linear Search
+- Linear Search (with find-all, multi-target and chunked parallel modes)
 - Binary Search (for sorted lists)
+- Batched Binary Search (many targets at once)
+- Lower/Upper Bound and equal-range count
+- Exponential (galloping) Search
+- Interpolation Search (for uniformly distributed numeric keys)
 
 Author: Mohsin Jafari
 GitHub: https://github.com/mohsinjafari
 """
 
+import os
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; pure-Python paths are used without it
+    np = None
+
 # ----------------------------
 # Linear Search
 # ----------------------------
 def linear_search(arr, target):
     """
     Perform a linear search on the given array to find the target value.
+    Lists, array.array, bytes/bytearray and NumPy arrays are scanned
+    with their built-in (C-level) search instead of a Python loop.
 
     Parameters:
     arr (list): The list of elements to search through.
@@ -23,12 +39,173 @@ def linear_search(arr, target):
     Returns:
     int: The index of the target if found, otherwise -1.
     """
+    if isinstance(arr, (bytes, bytearray)):
+        # The elements of bytes are ints, so only a byte value can match.
+        if isinstance(target, int) and 0 <= target < 256:
+            return arr.find(target)
+        return -1
+
+    if isinstance(arr, (list, tuple, array)):
+        try:
+            return arr.index(target)
+        except (ValueError, TypeError):
+            return -1
+
+    if np is not None and isinstance(arr, np.ndarray):
+        hits = np.flatnonzero(arr == target)
+        return int(hits[0]) if len(hits) else -1
+
+    for index in range(len(arr)):
+        if arr[index] == target:
+            return index
+    return -1
+
+
+def linear_search_all(arr, target):
+    """
+    Find every index at which target occurs in the array.
+
+    Parameters:
+    arr (list): The list of elements to search through.
+    target: The value to search for in the list.
+
+    Returns:
+    list: The indices of all occurrences of target, in ascending order.
+    """
+    if np is not None and isinstance(arr, np.ndarray):
+        return np.flatnonzero(arr == target).tolist()
+
+    result = []
+    if isinstance(arr, (bytes, bytearray, list, tuple, array)):
+        index = linear_search(arr, target)
+        while index != -1:
+            result.append(index)
+            if isinstance(arr, (bytes, bytearray)):
+                index = arr.find(target, index + 1)
+            else:
+                try:
+                    index = arr.index(target, index + 1)
+                except ValueError:
+                    index = -1
+        return result
+
     for index in range(len(arr)):
+        if arr[index] == target:
+            result.append(index)
+    return result
+
+
+def linear_search_many(arr, targets):
+    """
+    Find the first index of each of several (hashable) targets with a
+    single pass over the array. Unhashable items in the array never
+    match and are skipped. Numeric NumPy arrays are matched against all
+    targets at once with np.isin.
+
+    Parameters:
+    arr (list): The list of elements to search through.
+    targets (iterable): The values to search for.
+
+    Returns:
+    dict: Maps each target to the index of its first occurrence, or -1.
+    """
+    result = dict.fromkeys(targets, -1)
+    if np is not None and isinstance(arr, np.ndarray) and result:
+        keys = np.array(list(result))
+        if arr.dtype.kind in "biuf" and keys.dtype.kind in "biuf":
+            positions = np.flatnonzero(np.isin(arr, keys))
+            # return_index gives the first position of each distinct hit.
+            values, first = np.unique(arr[positions], return_index=True)
+            for value, i in zip(values.tolist(), first.tolist()):
+                if value in result:
+                    result[value] = int(positions[i])
+            return result
+
+    remaining = len(result)
+    for index, item in enumerate(arr):
+        if remaining == 0:
+            break
+        try:
+            missing = result.get(item, 0) == -1
+        except TypeError:  # unhashable item: cannot be one of the targets
+            continue
+        if missing:
+            result[item] = index
+            remaining -= 1
+    return result
+
+
+def _search_chunk(chunk, target, offset):
+    """Process worker: search a copied chunk and return the absolute index, or -1."""
+    index = linear_search(chunk, target)
+    return index + offset if index != -1 else -1
+
+
+def _search_range(arr, target, lo, hi):
+    """Thread worker: search arr[lo:hi] in place and return the index, or -1."""
+    if np is not None and isinstance(arr, np.ndarray):
+        index = linear_search(arr[lo:hi], target)  # a view, not a copy
+        return index + lo if index != -1 else -1
+    if isinstance(arr, (bytes, bytearray)):
+        if isinstance(target, int) and 0 <= target < 256:
+            return arr.find(target, lo, hi)
+        return -1
+    if isinstance(arr, (list, tuple, array)):
+        try:
+            return arr.index(target, lo, hi)
+        except (ValueError, TypeError):
+            return -1
+    for index in range(lo, hi):
         if arr[index] == target:
             return index
     return -1
 
 
+def parallel_linear_search(arr, target, workers=None, use_processes=False):
+    """
+    Perform a linear search on a very large array by splitting it into
+    chunks and scanning them concurrently in a thread or process pool.
+    Threads scan their range of the shared array in place and help when
+    the scan releases the GIL (e.g. NumPy); processes pay to copy each
+    chunk but scan in true parallel.
+
+    Parameters:
+    arr (list): The list of elements to search through.
+    target: The value to search for in the list.
+    workers (int, optional): Number of workers (defaults to the CPU count).
+    use_processes (bool): Use a process pool instead of a thread pool.
+
+    Returns:
+    int: The index of the first occurrence of target, otherwise -1.
+    """
+    n = len(arr)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or n < 2 * workers:
+        return linear_search(arr, target)
+
+    step = -(-n // workers)
+    pool_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with pool_class(max_workers=workers) as pool:
+        if use_processes:
+            futures = [
+                pool.submit(_search_chunk, arr[lo:lo + step], target, lo)
+                for lo in range(0, n, step)
+            ]
+        else:
+            futures = [
+                pool.submit(_search_range, arr, target, lo, min(lo + step, n))
+                for lo in range(0, n, step)
+            ]
+        # Chunks are in order, so the first hit is the earliest one.
+        for future in futures:
+            index = future.result()
+            if index != -1:
+                for rest in futures:
+                    rest.cancel()
+                return index
+    return -1
+
+
 # ----------------------------
 # Binary Search
 # ----------------------------
@@ -55,6 +232,194 @@ def binary_search(arr, target):
     return -1
 
 
+# ----------------------------
+# Batched Binary Search
+# ----------------------------
+def _is_sorted(seq):
+    """Return True if seq is in non-decreasing order."""
+    return all(not seq[i + 1] < seq[i] for i in range(len(seq) - 1))
+
+
+def binary_search_many(arr, targets):
+    """
+    Perform binary searches for many targets against the same sorted array.
+    When the targets are themselves sorted, each search gallops forward
+    from where the previous target was found, so the whole batch is
+    answered in a single co-scan of arr. NumPy arrays are searched with
+    a vectorized searchsorted.
+
+    Parameters:
+    arr (list): The sorted list of elements to search through.
+    targets (iterable): The values to search for.
+
+    Returns:
+    list: For each target, the index of its first occurrence in arr,
+    otherwise -1 (a NumPy array of indices when arr is a NumPy array).
+    """
+    if np is not None and isinstance(arr, np.ndarray):
+        targets = np.asarray(targets)
+        idx = np.searchsorted(arr, targets)
+        found = idx < len(arr)
+        found[found] = arr[idx[found]] == targets[found]
+        return np.where(found, idx, -1)
+
+    targets = list(targets)
+    n = len(arr)
+    result = []
+    if _is_sorted(targets):
+        lo = 0
+        for target in targets:
+            # Gallop: double the step until arr[lo + step] >= target.
+            step = 1
+            while lo + step < n and arr[lo + step] < target:
+                step *= 2
+            lo = bisect_left(arr, target, lo + step // 2, min(lo + step, n))
+            result.append(lo if lo < n and arr[lo] == target else -1)
+    else:
+        for target in targets:
+            index = bisect_left(arr, target)
+            result.append(index if index < n and arr[index] == target else -1)
+    return result
+
+
+# ----------------------------
+# Lower and Upper Bound
+# ----------------------------
+def lower_bound(arr, target, lo=0, hi=None):
+    """
+    Find the first position in the sorted array whose value is not less
+    than target (where target would be inserted before any equal values).
+
+    Parameters:
+    arr (list): The sorted list of elements to search through.
+    target: The value to search for.
+    lo, hi (int, optional): Restrict the search to arr[lo:hi].
+
+    Returns:
+    int: The position, between lo and hi inclusive.
+    """
+    if hi is None:
+        hi = len(arr)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if arr[mid] < target:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def upper_bound(arr, target, lo=0, hi=None):
+    """
+    Find the first position in the sorted array whose value is greater
+    than target (where target would be inserted after any equal values).
+
+    Parameters:
+    arr (list): The sorted list of elements to search through.
+    target: The value to search for.
+    lo, hi (int, optional): Restrict the search to arr[lo:hi].
+
+    Returns:
+    int: The position, between lo and hi inclusive.
+    """
+    if hi is None:
+        hi = len(arr)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if target < arr[mid]:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def count_equal(arr, target):
+    """
+    Count the occurrences of target in the sorted array using the
+    equal range [lower_bound, upper_bound).
+
+    Returns:
+    int: The number of elements equal to target.
+    """
+    return upper_bound(arr, target) - lower_bound(arr, target)
+
+
+# ----------------------------
+# Exponential (Galloping) Search
+# ----------------------------
+def exponential_search(arr, target, hint=0):
+    """
+    Perform an exponential search on the given sorted array, starting
+    at the hinted position. The search window doubles outward from hint
+    until it brackets target and is then bisected, so a target d
+    positions away from hint is found in O(log d) probes.
+
+    Parameters:
+    arr (list): The sorted list of elements to search through.
+    target: The value to search for in the list.
+    hint (int): Position to start from (e.g. the previous hit).
+
+    Returns:
+    int: The index of the first occurrence of target if found, otherwise -1.
+    """
+    n = len(arr)
+    if n == 0:
+        return -1
+    hint = min(max(hint, 0), n - 1)
+
+    step = 1
+    if arr[hint] < target:
+        # Gallop right: arr[lo] < target <= arr[hi]
+        lo = hint
+        while hint + step < n and arr[hint + step] < target:
+            lo = hint + step
+            step *= 2
+        hi = min(hint + step, n)
+    else:
+        # Gallop left: arr[lo] < target <= arr[hi]
+        hi = hint
+        while hint - step >= 0 and not arr[hint - step] < target:
+            hi = hint - step
+            step *= 2
+        lo = max(hint - step, 0)
+
+    index = lower_bound(arr, target, lo, hi)
+    if index < n and arr[index] == target:
+        return index
+    return -1
+
+
+# ----------------------------
+# Interpolation Search
+# ----------------------------
+def interpolation_search(arr, target):
+    """
+    Perform an interpolation search on the given sorted array of numbers.
+    Instead of the midpoint, each probe is placed where target would be
+    if the values were evenly spread between arr[left] and arr[right].
+    Takes O(log log n) probes on uniformly distributed keys.
+
+    Parameters:
+    arr (list): The sorted list of numbers to search through.
+    target: The number to search for in the list.
+
+    Returns:
+    int: The index of the target if found, otherwise -1.
+    """
+    left, right = 0, len(arr) - 1
+    while left <= right and arr[left] <= target <= arr[right]:
+        if arr[left] == arr[right]:
+            return left
+        pos = left + int((target - arr[left]) * (right - left) / (arr[right] - arr[left]))
+        if arr[pos] == target:
+            return pos
+        elif arr[pos] < target:
+            left = pos + 1
+        else:
+            right = pos - 1
+    return -1
+
+
 # ----------------------------
 # Example Usage
 # ----------------------------
@@ -64,5 +429,13 @@ if __name__ == "__main__":
     print("Original array:", arr)
     print("Linear search for 7:", linear_search(arr, 7))
     print("Linear search for 4:", linear_search(arr, 4))
+    print("Linear search all 3s:", linear_search_all([3, 1, 3, 2, 3], 3))
+    print("Linear search for many:", linear_search_many(arr, [9, 4, 1]))
     print("Binary search for 7:", binary_search(arr, 7))
     print("Binary search for 4:", binary_search(arr, 4))
+    print("Batched search for [1, 4, 9]:", binary_search_many(arr, [1, 4, 9]))
+    print("Lower bound of 6:", lower_bound(arr, 6))
+    print("Upper bound of 7:", upper_bound(arr, 7))
+    print("Count of 7:", count_equal(arr, 7))
+    print("Exponential search for 9:", exponential_search(arr, 9))
+    print("Interpolation search for 9:", interpolation_search(arr, 9))
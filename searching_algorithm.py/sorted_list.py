@@ -0,0 +1,323 @@
+"""
+sorted_list.py
+------------------------
+A list that keeps its items sorted, with fast insert and remove.
+
+Items are stored as a list of sorted sublists of bounded size, plus the
+maximum of each sublist. A value is located by binary searching the
+maxima and then the one sublist it falls in, so an insert or remove
+only shifts a few hundred items instead of the whole list. A Fenwick
+tree (binary indexed tree) over the sublist lengths maps between
+positions and (sublist, offset) pairs in O(log n).
+
+Features:
+- add, update, remove, discard, pop
+- index, bisect_left/bisect_right (rank), count, contains
+- Positional indexing and lazy range iteration (irange)
+- Iterable, sized, comparable to a list via list(...)
+
+Author: Mohsin Jafari
+GitHub: https://github.com/mohsinjafari
+"""
+
+from searching_algorithms import lower_bound, upper_bound
+
+DEFAULT_LOAD = 500
+
+
+class SortedList:
+    """A sorted sequence built from bounded-size sorted sublists."""
+
+    def __init__(self, iterable=None, load=DEFAULT_LOAD):
+        self.load = load
+        self.length = 0
+        self.lists = []
+        self.maxes = []
+        self.index_tree = [0]
+        if iterable is not None:
+            self.update(iterable)
+
+    # ----------------------------
+    # Positional index (Fenwick tree over sublist lengths)
+    # ----------------------------
+    def _build_index(self):
+        """Rebuild the Fenwick tree after sublists were added or removed."""
+        tree = [0] + [len(sub) for sub in self.lists]
+        size = len(tree)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                tree[parent] += tree[i]
+        self.index_tree = tree
+
+    def _update_index(self, pos, delta):
+        """Add delta to the length of sublist pos."""
+        tree = self.index_tree
+        i = pos + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _offset(self, pos):
+        """Return the number of items stored before sublist pos."""
+        tree = self.index_tree
+        total = 0
+        while pos > 0:
+            total += tree[pos]
+            pos -= pos & -pos
+        return total
+
+    def _locate(self, index):
+        """Return (sublist, offset) of the item at a valid position index."""
+        tree = self.index_tree
+        pos = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            nxt = pos + step
+            if nxt < len(tree) and tree[nxt] <= index:
+                pos = nxt
+                index -= tree[nxt]
+            step >>= 1
+        return pos, index
+
+    # ----------------------------
+    # Basic operations
+    # ----------------------------
+    def add(self, value):
+        """Insert value, after any equal values already present."""
+        lists, maxes = self.lists, self.maxes
+        self.length += 1
+        if not lists:
+            lists.append([value])
+            maxes.append(value)
+            self._build_index()
+            return
+
+        pos = upper_bound(maxes, value)
+        if pos == len(maxes):
+            pos -= 1
+            lists[pos].append(value)
+            maxes[pos] = value
+        else:
+            sub = lists[pos]
+            sub.insert(upper_bound(sub, value), value)
+
+        if len(lists[pos]) > 2 * self.load:
+            # Split an overgrown sublist in half.
+            sub = lists[pos]
+            half = sub[self.load:]
+            del sub[self.load:]
+            lists.insert(pos + 1, half)
+            maxes[pos] = sub[-1]
+            maxes.insert(pos + 1, half[-1])
+            self._build_index()
+        else:
+            self._update_index(pos, 1)
+
+    def update(self, iterable):
+        """Insert every value from iterable."""
+        values = list(iterable)
+        if not values:
+            return
+        if len(values) * 4 < self.length:
+            for value in values:
+                self.add(value)
+            return
+
+        # Large batch: sort everything once and re-chunk.
+        values = sorted(list(self) + values)
+        load = self.load
+        self.lists = [values[i:i + load] for i in range(0, len(values), load)]
+        self.maxes = [sub[-1] for sub in self.lists]
+        self.length = len(values)
+        self._build_index()
+
+    def _delete(self, pos, idx):
+        """Remove the item at offset idx of sublist pos."""
+        lists, maxes = self.lists, self.maxes
+        sub = lists[pos]
+        del sub[idx]
+        self.length -= 1
+
+        if not sub:
+            del lists[pos]
+            del maxes[pos]
+            self._build_index()
+        elif len(sub) < self.load // 2 and len(lists) > 1:
+            # Merge an underfull sublist into its neighbour.
+            if pos == 0:
+                pos = 1
+            prev = lists[pos - 1]
+            prev.extend(lists[pos])
+            del lists[pos]
+            del maxes[pos]
+            maxes[pos - 1] = prev[-1]
+            if len(prev) > 2 * self.load:
+                half = prev[self.load:]
+                del prev[self.load:]
+                lists.insert(pos, half)
+                maxes[pos - 1] = prev[-1]
+                maxes.insert(pos, half[-1])
+            self._build_index()
+        else:
+            maxes[pos] = sub[-1]
+            self._update_index(pos, -1)
+
+    def discard(self, value):
+        """Remove one occurrence of value if present. Returns True if removed."""
+        pos = lower_bound(self.maxes, value)
+        if pos == len(self.maxes):
+            return False
+        sub = self.lists[pos]
+        idx = lower_bound(sub, value)
+        if sub[idx] != value:
+            return False
+        self._delete(pos, idx)
+        return True
+
+    def remove(self, value):
+        """Remove one occurrence of value. Raises ValueError if not present."""
+        if not self.discard(value):
+            raise ValueError(f"{value!r} not in SortedList")
+
+    def pop(self, index=-1):
+        """Remove and return the item at index (the largest by default)."""
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("pop index out of range")
+        pos, idx = self._locate(index)
+        value = self.lists[pos][idx]
+        self._delete(pos, idx)
+        return value
+
+    def clear(self):
+        """Remove all items."""
+        self.length = 0
+        self.lists = []
+        self.maxes = []
+        self.index_tree = [0]
+
+    def is_empty(self):
+        """Check if the list is empty."""
+        return self.length == 0
+
+    # ----------------------------
+    # Searching
+    # ----------------------------
+    def bisect_left(self, value):
+        """Return the number of items less than value (its rank)."""
+        pos = lower_bound(self.maxes, value)
+        if pos == len(self.maxes):
+            return self.length
+        return self._offset(pos) + lower_bound(self.lists[pos], value)
+
+    def bisect_right(self, value):
+        """Return the number of items less than or equal to value."""
+        pos = upper_bound(self.maxes, value)
+        if pos == len(self.maxes):
+            return self.length
+        return self._offset(pos) + upper_bound(self.lists[pos], value)
+
+    def rank(self, value):
+        """Return the number of items less than value."""
+        return self.bisect_left(value)
+
+    def count(self, value):
+        """Return the number of occurrences of value."""
+        return self.bisect_right(value) - self.bisect_left(value)
+
+    def index(self, value):
+        """Return the position of the first occurrence of value. Raises ValueError if not present."""
+        pos = lower_bound(self.maxes, value)
+        if pos < len(self.maxes):
+            sub = self.lists[pos]
+            idx = lower_bound(sub, value)
+            if sub[idx] == value:
+                return self._offset(pos) + idx
+        raise ValueError(f"{value!r} not in SortedList")
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True)):
+        """
+        Lazily iterate over the items between minimum and maximum
+        (either may be None for an open end).
+        """
+        if minimum is None:
+            start = 0
+        elif inclusive[0]:
+            start = self.bisect_left(minimum)
+        else:
+            start = self.bisect_right(minimum)
+
+        if maximum is None:
+            stop = self.length
+        elif inclusive[1]:
+            stop = self.bisect_right(maximum)
+        else:
+            stop = self.bisect_left(maximum)
+
+        return self._iter_positions(start, stop)
+
+    def _iter_positions(self, start, stop):
+        """Yield the items at positions start (inclusive) to stop (exclusive)."""
+        if start >= stop:
+            return
+        remaining = stop - start
+        pos, idx = self._locate(start)
+        lists = self.lists
+        while remaining > 0:
+            sub = lists[pos]
+            chunk = sub[idx:idx + remaining]
+            yield from chunk
+            remaining -= len(chunk)
+            pos += 1
+            idx = 0
+
+    # ----------------------------
+    # Magic methods
+    # ----------------------------
+    def __len__(self):
+        return self.length
+
+    def __contains__(self, value):
+        pos = lower_bound(self.maxes, value)
+        if pos == len(self.maxes):
+            return False
+        sub = self.lists[pos]
+        return sub[lower_bound(sub, value)] == value
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("SortedList index out of range")
+        pos, idx = self._locate(index)
+        return self.lists[pos][idx]
+
+    def __iter__(self):
+        for sub in self.lists:
+            yield from sub
+
+    def __reversed__(self):
+        for sub in reversed(self.lists):
+            yield from reversed(sub)
+
+    def __repr__(self):
+        return "SortedList(" + repr(list(self)) + ")"
+
+
+# ----------------------------
+# Example usage (for testing)
+# ----------------------------
+if __name__ == "__main__":
+    sl = SortedList([5, 1, 9, 3])
+    sl.add(7)
+    sl.add(3)
+    print(sl)                                # SortedList([1, 3, 3, 5, 7, 9])
+    print("Index of 5:", sl.index(5))        # 3
+    print("Rank of 6:", sl.rank(6))          # 4
+    print("Count of 3:", sl.count(3))        # 2
+    print("Range 3..7:", list(sl.irange(3, 7)))
+    sl.remove(3)
+    print("Pop largest:", sl.pop())          # 9
+    print(sl)                                # SortedList([1, 3, 5, 7])
@@ -0,0 +1,201 @@
+"""
+external_sort.py
+------------------------
+External (out-of-core) Merge Sort for files larger than memory.
+
+Features:
+- Reads the input in chunks bounded by a memory budget
+- Sorts each chunk with merge_sort and spills it to a temporary run file
+- Heap-based k-way merge of the runs with a configurable fan-in
+- Newline-delimited text and fixed-width binary records
+
+Author: Mohsin Jafari
+GitHub: https://github.com/mohsinjafari
+"""
+
+import heapq
+import io
+import os
+import tempfile
+from functools import partial
+
+from sorting_algorithms import merge_sort
+
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024  # bytes
+DEFAULT_FAN_IN = 16
+
+
+# ----------------------------
+# Reading records
+# ----------------------------
+def _read_chunks(stream, record_size, memory_limit):
+    """
+    Yield lists of records from stream, each holding roughly
+    memory_limit bytes of record data.
+    Text records are lines (a missing final newline is added);
+    binary records are record_size bytes each.
+    """
+    if record_size is None:
+        chunk, used = [], 0
+        for line in stream:
+            if not line.endswith(b"\n"):
+                line += b"\n"
+            chunk.append(line)
+            used += len(line)
+            if used >= memory_limit:
+                yield chunk
+                chunk, used = [], 0
+        if chunk:
+            yield chunk
+    else:
+        per_chunk = max(1, memory_limit // record_size)
+        while True:
+            data = stream.read(per_chunk * record_size)
+            if not data:
+                break
+            if len(data) % record_size:
+                raise ValueError("input size is not a multiple of record_size")
+            yield [data[i:i + record_size] for i in range(0, len(data), record_size)]
+
+
+def _strip_newline(line):
+    """Default key for text records: the line without its terminator."""
+    return line.rstrip(b"\n")
+
+
+def _record_key(record_size, key):
+    """
+    Return the key used to order records. Text lines are compared without
+    their trailing newline, so a line sorts before any longer line it is a
+    prefix of; a user key receives the stripped line.
+    """
+    if record_size is not None:
+        return key
+    if key is None:
+        return _strip_newline
+    return lambda line: key(line.rstrip(b"\n"))
+
+
+def _iter_records(stream, record_size):
+    """Iterate over the records of an already sorted run file."""
+    if record_size is None:
+        return iter(stream)
+    return iter(partial(stream.read, record_size), b"")
+
+
+# ----------------------------
+# Run files
+# ----------------------------
+def _write_run(records, tmp_dir):
+    """Write records to a new temporary run file and return its path."""
+    fd, path = tempfile.mkstemp(suffix=".run", dir=tmp_dir)
+    with os.fdopen(fd, "wb") as f:
+        f.writelines(records)
+    return path
+
+
+def _merge_runs(paths, output, record_size, key, buffer_size):
+    """Heap-based k-way merge of the sorted run files into output."""
+    files = [open(path, "rb", buffering=buffer_size) for path in paths]
+    try:
+        streams = [_iter_records(f, record_size) for f in files]
+        output.writelines(heapq.merge(*streams, key=key))
+    finally:
+        for f in files:
+            f.close()
+
+
+# ----------------------------
+# External Sort
+# ----------------------------
+def external_sort(source, destination, record_size=None, key=None,
+                  memory_limit=DEFAULT_MEMORY_LIMIT, fan_in=DEFAULT_FAN_IN,
+                  tmp_dir=None):
+    """
+    Sort a file that does not fit in memory.
+    The input is split into sorted runs of at most memory_limit bytes,
+    which are then merged fan_in at a time until one run remains.
+    The sort is stable.
+
+    Parameters:
+    source: Path or binary file object to read from.
+    destination: Path or binary file object to write the sorted records to.
+    record_size (int, optional): Size of fixed-width binary records;
+        when None the input is treated as newline-delimited text.
+    key (callable, optional): Computes the sort key of each record (bytes).
+        Text records are passed to it without their trailing newline.
+    memory_limit (int): Approximate number of bytes of record data held
+        in memory at once. It counts record bytes only, not the overhead
+        of the Python objects holding them, so actual memory use is
+        higher. Each merge buffer is at least io.DEFAULT_BUFFER_SIZE, even
+        if that exceeds the limit.
+    fan_in (int): Maximum number of runs merged together in one pass.
+    tmp_dir (str, optional): Directory in which the temporary run files
+        are created.
+
+    Returns:
+    int: The number of runs the input was split into.
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    if record_size is not None and record_size <= 0:
+        raise ValueError("record_size must be positive")
+
+    key = _record_key(record_size, key)
+    # buffering=1 means line buffering, which binary files do not support.
+    buffer_size = max(io.DEFAULT_BUFFER_SIZE, memory_limit // (fan_in + 1))
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as work:
+        # Phase 1: sorted runs
+        runs = []
+        reader = open(source, "rb") if isinstance(source, (str, os.PathLike)) else source
+        try:
+            for chunk in _read_chunks(reader, record_size, memory_limit):
+                merge_sort(chunk, key=key, mode="bottom_up", in_place=True)
+                runs.append(_write_run(chunk, work))
+        finally:
+            if reader is not source:
+                reader.close()
+        run_count = len(runs)
+
+        # Phase 2: merge passes until at most fan_in runs are left
+        while len(runs) > fan_in:
+            merged = []
+            for i in range(0, len(runs), fan_in):
+                group = runs[i:i + fan_in]
+                fd, path = tempfile.mkstemp(suffix=".run", dir=work)
+                with os.fdopen(fd, "wb") as out:
+                    _merge_runs(group, out, record_size, key, buffer_size)
+                for done in group:
+                    os.remove(done)
+                merged.append(path)
+            runs = merged
+
+        # Phase 3: final merge into the destination
+        writer = open(destination, "wb") if isinstance(destination, (str, os.PathLike)) else destination
+        try:
+            _merge_runs(runs, writer, record_size, key, buffer_size)
+        finally:
+            if writer is not destination:
+                writer.close()
+    return run_count
+
+
+# ----------------------------
+# Example Usage
+# ----------------------------
+if __name__ == "__main__":
+    import random
+
+    with tempfile.TemporaryDirectory() as work:
+        src = os.path.join(work, "input.txt")
+        dst = os.path.join(work, "output.txt")
+        with open(src, "w") as f:
+            for _ in range(10_000):
+                f.write(f"{random.randint(0, 999_999):06d}\n")
+
+        runs = external_sort(src, dst, memory_limit=16 * 1024, fan_in=4)
+        with open(dst) as f:
+            lines = f.read().splitlines()
+        print("Runs created:", runs)
+        print("First five:", lines[:5])
+        print("Sorted:", lines == sorted(lines))
@@ -0,0 +1,240 @@
+"""
+selection.py
+------------------------
+Selection algorithms for when only part of the sorted order is needed.
+
+Features:
+- nth_element: Introselect (Quickselect with a guaranteed fallback), in place
+- top_k: k smallest/largest items of any iterable with a bounded heap
+- partial_sort: sort only the first k positions of a list
+
+Author: Mohsin Jafari
+GitHub: https://github.com/mohsinjafari
+"""
+
+import heapq
+from operator import itemgetter
+
+from sorting_algorithms import hybrid_sort
+
+
+# ----------------------------
+# Quickselect / Introselect
+# ----------------------------
+def _swap(keys, values, i, j):
+    """Swap positions i and j in keys (and in values, when it is separate)."""
+    keys[i], keys[j] = keys[j], keys[i]
+    if values is not None:
+        values[i], values[j] = values[j], values[i]
+
+
+def _median_of_three(keys, lo, hi):
+    """Return the index of the median of the first, middle and last keys."""
+    mid = (lo + hi - 1) // 2
+    a, b, c = keys[lo], keys[mid], keys[hi - 1]
+    if a < b:
+        if b < c:
+            return mid
+        return hi - 1 if a < c else lo
+    if a < c:
+        return lo
+    return hi - 1 if b < c else mid
+
+
+def _sort_range(keys, values, lo, hi):
+    """Fallback: sort keys[lo:hi] (and values alongside) outright."""
+    if values is None:
+        block = keys[lo:hi]
+        hybrid_sort(block)
+        keys[lo:hi] = block
+    else:
+        block = list(zip(keys[lo:hi], values[lo:hi]))
+        hybrid_sort(block, key=itemgetter(0))
+        keys[lo:hi] = [k for k, _ in block]
+        values[lo:hi] = [v for _, v in block]
+
+
+def _introselect(keys, values, k):
+    """
+    Rearrange keys (and values) so that keys[k] holds the k-th smallest key,
+    everything before it is not greater and everything after is not smaller.
+    """
+    lo, hi = 0, len(keys)
+    depth_limit = 2 * max(hi, 1).bit_length()
+    while hi - lo > 1:
+        if depth_limit == 0:
+            # Too many bad pivots: finish with an O(m log m) sort.
+            _sort_range(keys, values, lo, hi)
+            return
+        depth_limit -= 1
+
+        pivot = keys[_median_of_three(keys, lo, hi)]
+
+        # Three-way partition: [lo, lt) < pivot, [lt, gt) == pivot, [gt, hi) > pivot
+        lt, i, gt = lo, lo, hi
+        while i < gt:
+            if keys[i] < pivot:
+                _swap(keys, values, lt, i)
+                lt += 1
+                i += 1
+            elif pivot < keys[i]:
+                gt -= 1
+                _swap(keys, values, i, gt)
+            else:
+                i += 1
+
+        if k < lt:
+            hi = lt
+        elif k >= gt:
+            lo = gt
+        else:
+            return
+
+
+def nth_element(arr, k, key=None):
+    """
+    Partially order the list in place so that arr[k] is the element that
+    would be at position k if the list were sorted; elements before it
+    are not greater and elements after it are not smaller.
+    Runs in O(n) average time; falls back to sorting the remaining range
+    after too many unbalanced partitions.
+
+    Parameters:
+    arr (list): The list to rearrange.
+    k (int): The position to select (negative values count from the end).
+    key (callable, optional): Computes the comparison key of each
+        element; each key is computed only once.
+
+    Returns:
+    The k-th smallest element.
+    """
+    n = len(arr)
+    if k < 0:
+        k += n
+    if not 0 <= k < n:
+        raise IndexError("nth_element index out of range")
+
+    if key is None:
+        _introselect(arr, None, k)
+    else:
+        keys = [key(item) for item in arr]
+        _introselect(keys, arr, k)
+    return arr[k]
+
+
+def quickselect(arr, k, key=None):
+    """
+    Return the k-th smallest element (0-based) without fully sorting.
+    The list is rearranged in place as described in nth_element.
+    """
+    return nth_element(arr, k, key)
+
+
+# ----------------------------
+# Top-k with a bounded heap
+# ----------------------------
+class _MaxFirst:
+    """Heap entry that reverses the order, turning heapq into a max-heap."""
+    __slots__ = ("key", "order", "item")
+
+    def __init__(self, key, order, item):
+        self.key = key
+        self.order = order
+        self.item = item
+
+    def __lt__(self, other):
+        if other.key < self.key:
+            return True
+        if self.key < other.key:
+            return False
+        return other.order < self.order
+
+
+def _identity(item):
+    return item
+
+
+def top_k(iterable, k, key=None, largest=True):
+    """
+    Return the k largest (or smallest) items of any iterable.
+    Streams over the input keeping only a heap of the best k items seen,
+    so it runs in O(n log k) time and O(k) memory. Equal items keep
+    their input order.
+
+    Parameters:
+    iterable: The items to select from.
+    k (int): Number of items to return.
+    key (callable, optional): Computes the comparison key of each item.
+    largest (bool): Return the largest items (descending) when True,
+        the smallest items (ascending) when False.
+
+    Returns:
+    list: Up to k items, best first.
+    """
+    if k <= 0:
+        return []
+    if key is None:
+        key = _identity
+
+    heap = []
+    if largest:
+        # Min-heap of (key, -order, item): the root is the weakest kept item.
+        for order, item in enumerate(iterable):
+            entry = (key(item), -order, item)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif heap[0] < entry:
+                heapq.heapreplace(heap, entry)
+        heap.sort(reverse=True)
+        return [item for _, _, item in heap]
+
+    for order, item in enumerate(iterable):
+        entry = _MaxFirst(key(item), order, item)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif heap[0] < entry:
+            heapq.heapreplace(heap, entry)
+    heap.sort(reverse=True)
+    return [entry.item for entry in heap]
+
+
+# ----------------------------
+# Partial Sort
+# ----------------------------
+def partial_sort(arr, k, key=None):
+    """
+    Sort only the first k positions of the list in place: afterwards
+    arr[:k] holds the k smallest elements in sorted order and the rest
+    of the list is left in unspecified order.
+    Costs O(n + k log k) on average instead of O(n log n).
+
+    Parameters:
+    arr (list): The list to rearrange.
+    k (int): Number of leading positions to sort.
+    key (callable, optional): Computes the comparison key of each element.
+
+    Returns:
+    list: The same list.
+    """
+    k = min(k, len(arr))
+    if k <= 0:
+        return arr
+    if k < len(arr):
+        nth_element(arr, k - 1, key)
+    head = arr[:k]
+    hybrid_sort(head, key)
+    arr[:k] = head
+    return arr
+
+
+# ----------------------------
+# Example Usage
+# ----------------------------
+if __name__ == "__main__":
+    arr = [64, 25, 12, 22, 11, 90, 5]
+
+    print("Original array:", arr)
+    print("Median:", nth_element(arr.copy(), len(arr) // 2))
+    print("Top 3 largest:", top_k(arr, 3))
+    print("Top 3 smallest:", top_k(arr, 3, largest=False))
+    print("Partial sort (k=3):", partial_sort(arr.copy(), 3))
@@ -0,0 +1,373 @@
+"""
+sort_benchmark.py
+------------------------
+Benchmark and regression suite for the functions in sorting_algorithms.py.
+
+Features:
+- Times every sort over a matrix of input sizes and distributions
+  (random, sorted, reversed, few-unique, organ-pipe, nearly-sorted)
+- Records peak memory (tracemalloc), comparisons and writes back into
+  the input list (input_writes; moves into a sort's own buffers are not
+  counted, so this is not a total data-movement metric)
+- Emits results as JSON
+- Compares results against a stored baseline: a tight tolerance for the
+  deterministic metrics and a looser one, with a minimum-duration floor,
+  for wall-clock time
+
+Usage:
+python sort_benchmark.py --sizes 100 1000 10000 --output results.json
+python sort_benchmark.py --baseline results.json --tolerance 0.05 --time-tolerance 0.5
+
+Author: Mohsin Jafari
+GitHub: https://github.com/mohsinjafari
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from sorting_algorithms import (
+    bubble_sort,
+    counting_sort,
+    hybrid_sort,
+    insertion_sort,
+    merge_sort,
+    radix_sort,
+    selection_sort,
+)
+
+DEFAULT_SIZES = [100, 1000, 10000]
+DEFAULT_TOLERANCE = 0.10       # comparisons, input writes, peak bytes
+DEFAULT_TIME_TOLERANCE = 0.50  # wall-clock seconds are noisy run to run
+MIN_SECONDS = 0.02             # faster cases are too noisy to compare
+QUADRATIC_LIMIT = 5000  # O(n^2) sorts are skipped above this size
+MIN_BASELINE_REPEAT = 3  # best-of-1 timings are too noisy to gate on
+
+# name -> (function, is comparison sort, is quadratic)
+SORTS = {
+    "selection_sort": (selection_sort, True, True),
+    "insertion_sort": (insertion_sort, True, True),
+    "bubble_sort": (bubble_sort, True, True),
+    "merge_sort": (lambda arr: merge_sort(arr, in_place=True), True, False),
+    "merge_sort_bottom_up": (
+        lambda arr: merge_sort(arr, mode="bottom_up", in_place=True), True, False
+    ),
+    # Its comparisons run in C on a shared buffer and cannot be counted, and
+    # peak_bytes only covers the parent process, not the workers.
+    "merge_sort_parallel": (
+        lambda arr: merge_sort(arr, mode="parallel", in_place=True, parallel_threshold=2),
+        False, False,
+    ),
+    "hybrid_sort": (hybrid_sort, True, False),
+    "counting_sort": (counting_sort, False, False),
+    "radix_sort": (radix_sort, False, False),
+}
+
+
+# ----------------------------
+# Input distributions
+# ----------------------------
+def random_data(n, rng):
+    return [rng.randrange(n * 4 or 1) for _ in range(n)]
+
+
+def sorted_data(n, rng):
+    return list(range(n))
+
+
+def reversed_data(n, rng):
+    return list(range(n, 0, -1))
+
+
+def few_unique_data(n, rng):
+    return [rng.randrange(8) for _ in range(n)]
+
+
+def organ_pipe_data(n, rng):
+    half = n // 2
+    return list(range(half)) + list(range(n - half, 0, -1))
+
+
+def nearly_sorted_data(n, rng):
+    data = list(range(n))
+    for _ in range(max(1, n // 100)):
+        i, j = rng.randrange(n), rng.randrange(n)
+        data[i], data[j] = data[j], data[i]
+    return data
+
+
+DISTRIBUTIONS = {
+    "random": random_data,
+    "sorted": sorted_data,
+    "reversed": reversed_data,
+    "few_unique": few_unique_data,
+    "organ_pipe": organ_pipe_data,
+    "nearly_sorted": nearly_sorted_data,
+}
+
+
+# ----------------------------
+# Instrumentation
+# ----------------------------
+class _Counter:
+    """Shared comparison counter."""
+    comparisons = 0
+
+
+class _Counted:
+    """Wraps a value and counts every comparison made against it."""
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        _Counter.comparisons += 1
+        return self.value < other.value
+
+    def __gt__(self, other):
+        _Counter.comparisons += 1
+        return self.value > other.value
+
+    def __le__(self, other):
+        _Counter.comparisons += 1
+        return self.value <= other.value
+
+    def __ge__(self, other):
+        _Counter.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        _Counter.comparisons += 1
+        return self.value == other.value
+
+    __hash__ = None
+
+
+class _CountingList(list):
+    """A list that counts the element writes made into it."""
+
+    def __init__(self, items):
+        super().__init__(items)
+        self.writes = 0
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self.writes += len(value)
+        else:
+            self.writes += 1
+        super().__setitem__(index, value)
+
+    def insert(self, index, value):
+        self.writes += 1
+        super().insert(index, value)
+
+
+# ----------------------------
+# Measurements
+# ----------------------------
+def _time_sort(func, data, repeat):
+    """Return the best wall time of func over repeat fresh copies of data."""
+    best = float("inf")
+    for _ in range(repeat):
+        arr = list(data)
+        start = time.perf_counter()
+        func(arr)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_memory(func, data):
+    """Return the peak bytes allocated while func sorts a copy of data."""
+    arr = list(data)
+    tracemalloc.start()
+    try:
+        func(arr)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def _count_operations(func, data, is_comparison_sort):
+    """
+    Return (comparisons, input_writes) for one run of func.
+    input_writes counts only element writes into the input list itself;
+    writes into a sort's own scratch lists (merge buffers, slices, count
+    arrays) are not seen, so it measures how much a sort rewrites its
+    input, not its total data movement, and is not comparable across
+    algorithms with different buffering. Comparisons are only counted for
+    comparison sorts and are None otherwise.
+    """
+    if is_comparison_sort:
+        _Counter.comparisons = 0
+        arr = _CountingList(_Counted(value) for value in data)
+        func(arr)
+        return _Counter.comparisons, arr.writes
+
+    arr = _CountingList(data)
+    func(arr)
+    return None, arr.writes
+
+
+def run_benchmarks(sizes=None, distributions=None, sorts=None, repeat=3,
+                   seed=0, quadratic_limit=QUADRATIC_LIMIT):
+    """
+    Benchmark every selected sort on every size and distribution.
+
+    Parameters:
+    sizes (list of int): Input sizes.
+    distributions (list of str): Keys of DISTRIBUTIONS.
+    sorts (list of str): Keys of SORTS.
+    repeat (int): Timing runs per case; the best time is kept.
+    seed (int): Seed for the input generators.
+    quadratic_limit (int): O(n^2) sorts are skipped above this size.
+
+    Returns:
+    dict: {"meta": {...}, "results": [{"sort", "distribution", "size",
+    "seconds", "peak_bytes", "comparisons", "input_writes"}, ...]}
+    """
+    sizes = sizes or DEFAULT_SIZES
+    distributions = distributions or list(DISTRIBUTIONS)
+    sorts = sorts or list(SORTS)
+
+    results = []
+    for dist in distributions:
+        for n in sizes:
+            data = DISTRIBUTIONS[dist](n, random.Random(seed))
+            expected = sorted(data)
+            for name in sorts:
+                func, is_comparison_sort, is_quadratic = SORTS[name]
+                if is_quadratic and n > quadratic_limit:
+                    continue
+
+                check = list(data)
+                func(check)
+                if check != expected:
+                    raise AssertionError(f"{name} failed on {dist} input of size {n}")
+
+                comparisons, input_writes = _count_operations(func, data, is_comparison_sort)
+                results.append({
+                    "sort": name,
+                    "distribution": dist,
+                    "size": n,
+                    "seconds": _time_sort(func, data, repeat),
+                    "peak_bytes": _peak_memory(func, data),
+                    "comparisons": comparisons,
+                    "input_writes": input_writes,
+                })
+
+    meta = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "seed": seed,
+    }
+    return {"meta": meta, "results": results}
+
+
+# ----------------------------
+# Baseline comparison
+# ----------------------------
+def compare_to_baseline(current, baseline, tolerance=DEFAULT_TOLERANCE,
+                        time_tolerance=DEFAULT_TIME_TOLERANCE, min_seconds=MIN_SECONDS):
+    """
+    Compare two benchmark reports case by case.
+    A metric regresses when it exceeds the baseline value by more than its
+    tolerance (a fraction, e.g. 0.1 for 10%): tolerance for the
+    deterministic metrics (comparisons, input writes, peak bytes) and
+    time_tolerance for seconds. Timings are only compared when the
+    baseline took at least min_seconds. Cases or metrics missing from
+    either report are ignored.
+
+    Returns:
+    list of dict: One entry per regressed metric with the case, metric,
+    baseline and current values.
+    """
+    def case(row):
+        return row["sort"], row["distribution"], row["size"]
+
+    base_rows = {case(row): row for row in baseline["results"]}
+    regressions = []
+    for row in current["results"]:
+        base = base_rows.get(case(row))
+        if base is None:
+            continue
+        for metric in ("seconds", "peak_bytes", "comparisons", "input_writes"):
+            old, new = base.get(metric), row.get(metric)
+            if old is None or new is None:
+                continue
+            limit = tolerance
+            if metric == "seconds":
+                if old < min_seconds:
+                    continue
+                limit = time_tolerance
+            if new > old * (1 + limit):
+                regressions.append({
+                    "sort": row["sort"],
+                    "distribution": row["distribution"],
+                    "size": row["size"],
+                    "metric": metric,
+                    "baseline": old,
+                    "current": new,
+                })
+    return regressions
+
+
+# ----------------------------
+# Command line
+# ----------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark sorting_algorithms.py")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--distributions", nargs="+", choices=list(DISTRIBUTIONS))
+    parser.add_argument("--sorts", nargs="+", choices=list(SORTS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed growth of comparisons, input writes and peak bytes")
+    parser.add_argument("--time-tolerance", type=float, default=DEFAULT_TIME_TOLERANCE,
+                        help="allowed growth of wall-clock seconds")
+    parser.add_argument("--min-seconds", type=float, default=MIN_SECONDS,
+                        help="skip timing comparisons for faster baseline cases")
+    args = parser.parse_args(argv)
+    if args.baseline and args.repeat < MIN_BASELINE_REPEAT:
+        parser.error(f"--baseline needs --repeat {MIN_BASELINE_REPEAT} or more")
+
+    report = run_benchmarks(args.sizes, args.distributions, args.sorts,
+                            args.repeat, args.seed)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline["meta"].get("repeat", 0) < MIN_BASELINE_REPEAT:
+            parser.error(f"{args.baseline} was recorded with fewer than "
+                         f"{MIN_BASELINE_REPEAT} repeats")
+        regressions = compare_to_baseline(report, baseline, args.tolerance,
+                                          args.time_tolerance, args.min_seconds)
+        for r in regressions:
+            print(
+                f"REGRESSION {r['sort']} {r['distribution']} n={r['size']} "
+                f"{r['metric']}: {r['baseline']} -> {r['current']}",
+                file=sys.stderr,
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
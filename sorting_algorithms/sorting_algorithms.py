@@ -6,11 +6,23 @@ Implement common sorting algorithms in Python including:
 - Insertion Sort
 - Bubble Sort
 - Merge Sort
+- Hybrid Sort (run-detecting merge sort with galloping)
+- Counting Sort and LSD Radix Sort (integer and bytes keys)
 
 Author: Mohsin Jafari
 GitHub: https://github.com/mohsinjafari
 """
 
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; pure-Python paths are used without it
+    np = None
+
 # ----------------------------
 # Selection Sort
 # ----------------------------
@@ -76,39 +88,922 @@ def bubble_sort(arr):
 def merge(lst1, lst2):
     """
     Merge two sorted lists into a single sorted list.
+    On ties the element from lst1 is taken first, so the merge is stable.
     """
     i, j = 0, 0
     result = []
     while i < len(lst1) and j < len(lst2):
-        if lst1[i] < lst2[j]:
-            result.append(lst1[i])
-            i += 1
-        else:
+        if lst2[j] < lst1[i]:
             result.append(lst2[j])
             j += 1
+        else:
+            result.append(lst1[i])
+            i += 1
 
     result += lst1[i:]
     result += lst2[j:]
     return result
 
 
+def _merge_into(src, dst, lo, mid, hi):
+    """
+    Stable merge of the sorted slices src[lo:mid] and src[mid:hi]
+    into dst[lo:hi].
+    """
+    i, j, k = lo, mid, lo
+    while i < mid and j < hi:
+        if src[j] < src[i]:
+            dst[k] = src[j]
+            j += 1
+        else:
+            dst[k] = src[i]
+            i += 1
+        k += 1
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+    else:
+        dst[k:hi] = src[j:hi]
+
+
+def _merge_keyed_into(src_keys, src_vals, dst_keys, dst_vals, lo, mid, hi):
+    """
+    Same as _merge_into, but compares precomputed keys and moves the
+    matching values along with them.
+    """
+    i, j, k = lo, mid, lo
+    while i < mid and j < hi:
+        if src_keys[j] < src_keys[i]:
+            dst_keys[k] = src_keys[j]
+            dst_vals[k] = src_vals[j]
+            j += 1
+        else:
+            dst_keys[k] = src_keys[i]
+            dst_vals[k] = src_vals[i]
+            i += 1
+        k += 1
+    if i < mid:
+        dst_keys[k:hi] = src_keys[i:mid]
+        dst_vals[k:hi] = src_vals[i:mid]
+    else:
+        dst_keys[k:hi] = src_keys[j:hi]
+        dst_vals[k:hi] = src_vals[j:hi]
+
+
 # ----------------------------
 # Merge Sort
 # ----------------------------
-def merge_sort(arr):
+def _top_down_merge_sort(arr):
     """
-    Sort the list using Merge Sort algorithm.
     Divide the list into halves, recursively sort each half, and merge.
     """
     if len(arr) <= 1:
         return arr
 
     mid = len(arr) // 2
-    left = merge_sort(arr[:mid])
-    right = merge_sort(arr[mid:])
+    left = _top_down_merge_sort(arr[:mid])
+    right = _top_down_merge_sort(arr[mid:])
     return merge(left, right)
 
 
+def _bottom_up_merge_sort(arr, key=None):
+    """
+    Sort arr in place by merging runs of width 1, 2, 4, ... iteratively.
+    Each pass merges from one list into the other, alternating between
+    arr and a single preallocated buffer, so no temporary lists are
+    created per merge and there is no recursion.
+    """
+    n = len(arr)
+    if n <= 1:
+        return arr
+
+    src_vals, dst_vals = arr, [None] * n
+    if key is not None:
+        src_keys, dst_keys = [key(item) for item in arr], [None] * n
+
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            if key is None:
+                _merge_into(src_vals, dst_vals, lo, mid, hi)
+            else:
+                _merge_keyed_into(src_keys, src_vals, dst_keys, dst_vals, lo, mid, hi)
+        src_vals, dst_vals = dst_vals, src_vals
+        if key is not None:
+            src_keys, dst_keys = dst_keys, src_keys
+        width *= 2
+
+    # After an odd number of passes the result sits in the buffer.
+    if src_vals is not arr:
+        arr[:] = src_vals
+    return arr
+
+
+# ----------------------------
+# Parallel Merge Sort (shared memory)
+# ----------------------------
+PARALLEL_THRESHOLD = 100_000
+
+
+def _to_numeric_array(arr):
+    """
+    Return arr as an array.array of machine integers or floats, or None
+    unless every value is an int that fits in 64 bits or every value is
+    a float. bool and other int subclasses are rejected, so they are not
+    turned into plain ints.
+    """
+    if isinstance(arr, array):
+        return arr if arr.typecode != "u" else None
+    if all(type(item) is int for item in arr):
+        try:
+            return array("q", arr)
+        except OverflowError:
+            return None
+    if all(type(item) is float for item in arr):
+        return array("d", arr)
+    return None
+
+
+def _sort_shared_chunk(shm_name, typecode, lo, hi):
+    """
+    Worker: sort the items [lo, hi) of a shared memory block in place.
+    Only the block name and bounds are sent to the worker; the data
+    itself is never pickled.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    view = shm.buf.cast(typecode)
+    try:
+        view[lo:hi] = array(typecode, sorted(view[lo:hi]))
+    finally:
+        view.release()
+        shm.close()
+
+
+def _parallel_merge_sort(arr, workers=None):
+    """
+    Sort numeric data by splitting it into one chunk per worker, sorting
+    the chunks in a process pool over shared memory, and merging the
+    sorted chunks. Returns a new list, or None if arr is not numeric.
+    """
+    data = _to_numeric_array(arr)
+    if data is None:
+        return None
+
+    n = len(data)
+    workers = workers or os.cpu_count() or 1
+    step = max(1, -(-n // workers))
+    bounds = [(lo, min(lo + step, n)) for lo in range(0, n, step)]
+
+    shm = shared_memory.SharedMemory(create=True, size=n * data.itemsize)
+    view = shm.buf.cast(data.typecode)
+    try:
+        view[:n] = data
+        with ProcessPoolExecutor(max_workers=len(bounds)) as pool:
+            futures = [
+                pool.submit(_sort_shared_chunk, shm.name, data.typecode, lo, hi)
+                for lo, hi in bounds
+            ]
+            for future in futures:
+                future.result()
+        # The chunks are already sorted runs, which list.sort detects and
+        # merges in C; heapq.merge would compare every item in Python.
+        result = view[:n].tolist()
+        result.sort()
+        return result
+    finally:
+        view.release()
+        shm.close()
+        shm.unlink()
+
+
+def merge_sort(arr, key=None, mode="top_down", in_place=False,
+               workers=None, parallel_threshold=PARALLEL_THRESHOLD):
+    """
+    Sort the list using Merge Sort algorithm. The sort is stable.
+
+    Parameters:
+    arr (list): The list to sort.
+    key (callable, optional): Computes the sort key of each element;
+        each key is computed only once.
+    mode (str): "top_down" recursively splits the list into halves and
+        merges them; "bottom_up" merges iteratively through a single
+        auxiliary buffer, avoiding recursion and per-merge temporary lists;
+        "parallel" sorts chunks of numeric data in a process pool over
+        shared memory and merges them. It supports lists whose values are
+        all ints fitting in 64 bits or all floats (not bool or other
+        subclasses), and numeric array.array inputs.
+    in_place (bool): Write the result back into arr instead of
+        returning a new list.
+    workers (int, optional): Number of worker processes for the
+        "parallel" mode (defaults to the CPU count).
+    parallel_threshold (int): Inputs shorter than this, inputs sorted
+        with a key, and non-numeric inputs fall back to "bottom_up"
+        in the "parallel" mode.
+
+    Returns:
+    list: The sorted list (arr itself when in_place is True).
+    """
+    if mode == "top_down":
+        if key is None:
+            result = _top_down_merge_sort(arr)
+        else:
+            # The index breaks ties, so elements themselves are never compared.
+            decorated = [(key(item), i, item) for i, item in enumerate(arr)]
+            result = [item for _, _, item in _top_down_merge_sort(decorated)]
+        if in_place:
+            arr[:] = result
+            return arr
+        return result
+
+    if mode == "parallel":
+        if key is None and len(arr) > 1 and len(arr) >= parallel_threshold:
+            result = _parallel_merge_sort(arr, workers)
+            if result is not None:
+                if in_place:
+                    arr[:] = result if isinstance(arr, list) else array(arr.typecode, result)
+                    return arr
+                return result
+        mode = "bottom_up"
+
+    if mode == "bottom_up":
+        target = arr if in_place else list(arr)
+        return _bottom_up_merge_sort(target, key)
+
+    raise ValueError(f"Unknown merge sort mode: {mode!r}")
+
+# ----------------------------
+# Hybrid Sort (run-detecting, Timsort-style)
+# ----------------------------
+MIN_MERGE = 32
+MIN_GALLOP = 7
+
+
+def _min_run_length(n):
+    """
+    Return the minimum run length for a list of size n.
+    Chosen so that n / min_run is a power of two (or slightly less),
+    which keeps the final merges balanced.
+    """
+    r = 0
+    while n >= MIN_MERGE:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def _count_run(a, lo, hi):
+    """
+    Return the length of the natural run starting at a[lo].
+    A strictly descending run is reversed in place so every run ends up
+    ascending (strictness keeps the sort stable).
+    """
+    run_hi = lo + 1
+    if run_hi == hi:
+        return 1
+
+    if a[run_hi] < a[lo]:
+        run_hi += 1
+        while run_hi < hi and a[run_hi] < a[run_hi - 1]:
+            run_hi += 1
+        a[lo:run_hi] = a[lo:run_hi][::-1]
+    else:
+        run_hi += 1
+        while run_hi < hi and not a[run_hi] < a[run_hi - 1]:
+            run_hi += 1
+    return run_hi - lo
+
+
+def _binary_insertion_sort(a, lo, hi, start):
+    """
+    Sort a[lo:hi] given that a[lo:start] is already sorted.
+    The insertion point is found by bisection and equal elements are
+    inserted after their peers, so the sort stays stable.
+    """
+    for i in range(start, hi):
+        pivot = a[i]
+        left, right = lo, i
+        while left < right:
+            mid = (left + right) // 2
+            if pivot < a[mid]:
+                right = mid
+            else:
+                left = mid + 1
+        if left != i:
+            a[left + 1:i + 1] = a[left:i]
+            a[left] = pivot
+
+
+def _gallop_left(key, a, base, length, hint):
+    """
+    Return the leftmost position k in a[base:base + length] at which key
+    could be inserted (a[base + k - 1] < key <= a[base + k]).
+    Searches outward from hint in exponential steps, then bisects.
+    """
+    last_ofs, ofs = 0, 1
+    if a[base + hint] < key:
+        max_ofs = length - hint
+        while ofs < max_ofs and a[base + hint + ofs] < key:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        if ofs > max_ofs:
+            ofs = max_ofs
+        last_ofs += hint
+        ofs += hint
+    else:
+        max_ofs = hint + 1
+        while ofs < max_ofs and not a[base + hint - ofs] < key:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        if ofs > max_ofs:
+            ofs = max_ofs
+        last_ofs, ofs = hint - ofs, hint - last_ofs
+
+    last_ofs += 1
+    while last_ofs < ofs:
+        mid = last_ofs + ((ofs - last_ofs) >> 1)
+        if a[base + mid] < key:
+            last_ofs = mid + 1
+        else:
+            ofs = mid
+    return ofs
+
+
+def _gallop_right(key, a, base, length, hint):
+    """
+    Return the rightmost position k in a[base:base + length] at which key
+    could be inserted (a[base + k - 1] <= key < a[base + k]).
+    """
+    last_ofs, ofs = 0, 1
+    if key < a[base + hint]:
+        max_ofs = hint + 1
+        while ofs < max_ofs and key < a[base + hint - ofs]:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        if ofs > max_ofs:
+            ofs = max_ofs
+        last_ofs, ofs = hint - ofs, hint - last_ofs
+    else:
+        max_ofs = length - hint
+        while ofs < max_ofs and not key < a[base + hint + ofs]:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        if ofs > max_ofs:
+            ofs = max_ofs
+        last_ofs += hint
+        ofs += hint
+
+    last_ofs += 1
+    while last_ofs < ofs:
+        mid = last_ofs + ((ofs - last_ofs) >> 1)
+        if key < a[base + mid]:
+            ofs = mid
+        else:
+            last_ofs = mid + 1
+    return ofs
+
+
+class _HybridSorter:
+    """
+    Sorting state for hybrid_sort: the list being sorted, the stack of
+    pending runs, the adaptive gallop threshold and one scratch buffer
+    that is reused by every merge.
+    """
+
+    def __init__(self, a):
+        self.a = a
+        self.runs = []
+        self.tmp = []
+        self.min_gallop = MIN_GALLOP
+
+    def sort(self):
+        a = self.a
+        n = len(a)
+        if n < 2:
+            return
+
+        if n < MIN_MERGE:
+            run_len = _count_run(a, 0, n)
+            _binary_insertion_sort(a, 0, n, run_len)
+            return
+
+        min_run = _min_run_length(n)
+        lo, remaining = 0, n
+        while remaining:
+            run_len = _count_run(a, lo, n)
+            if run_len < min_run:
+                force = min(remaining, min_run)
+                _binary_insertion_sort(a, lo, lo + force, lo + run_len)
+                run_len = force
+            self.runs.append([lo, run_len])
+            self._merge_collapse()
+            lo += run_len
+            remaining -= run_len
+        self._merge_force_collapse()
+
+    def _scratch(self, size):
+        """Return the scratch buffer, grown to hold at least size items."""
+        if len(self.tmp) < size:
+            self.tmp.extend([None] * (size - len(self.tmp)))
+        return self.tmp
+
+    def _merge_collapse(self):
+        """Merge runs until the run-length invariants hold again."""
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or (
+                n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]
+            ):
+                if runs[n - 1][1] < runs[n + 1][1]:
+                    n -= 1
+            elif runs[n][1] > runs[n + 1][1]:
+                break
+            self._merge_at(n)
+
+    def _merge_force_collapse(self):
+        """Merge all remaining runs into one."""
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+            self._merge_at(n)
+
+    def _merge_at(self, i):
+        """Merge the runs at stack positions i and i + 1."""
+        a = self.a
+        base1, len1 = self.runs[i]
+        base2, len2 = self.runs[i + 1]
+        self.runs[i][1] = len1 + len2
+        del self.runs[i + 1]
+
+        # Elements of run1 already <= run2[0] are in place.
+        k = _gallop_right(a[base2], a, base1, len1, 0)
+        base1 += k
+        len1 -= k
+        if len1 == 0:
+            return
+
+        # Elements of run2 already >= run1[-1] are in place.
+        len2 = _gallop_left(a[base1 + len1 - 1], a, base2, len2, len2 - 1)
+        if len2 == 0:
+            return
+
+        if len1 <= len2:
+            self._merge_lo(base1, len1, base2, len2)
+        else:
+            self._merge_hi(base1, len1, base2, len2)
+
+    def _merge_lo(self, base1, len1, base2, len2):
+        """
+        Merge two adjacent runs left to right; run1 (the shorter one)
+        is copied into the scratch buffer first.
+        """
+        a = self.a
+        tmp = self._scratch(len1)
+        tmp[0:len1] = a[base1:base1 + len1]
+        cursor1, cursor2, dest = 0, base2, base1
+
+        a[dest] = a[cursor2]
+        dest += 1
+        cursor2 += 1
+        len2 -= 1
+        if len2 == 0:
+            a[dest:dest + len1] = tmp[cursor1:cursor1 + len1]
+            return
+        if len1 == 1:
+            a[dest:dest + len2] = a[cursor2:cursor2 + len2]
+            a[dest + len2] = tmp[cursor1]
+            return
+
+        min_gallop = self.min_gallop
+        done = False
+        while not done:
+            count1 = count2 = 0
+
+            # One pair at a time until one run keeps winning.
+            while True:
+                if a[cursor2] < tmp[cursor1]:
+                    a[dest] = a[cursor2]
+                    dest += 1
+                    cursor2 += 1
+                    count2 += 1
+                    count1 = 0
+                    len2 -= 1
+                    if len2 == 0:
+                        done = True
+                        break
+                else:
+                    a[dest] = tmp[cursor1]
+                    dest += 1
+                    cursor1 += 1
+                    count1 += 1
+                    count2 = 0
+                    len1 -= 1
+                    if len1 == 1:
+                        done = True
+                        break
+                if (count1 | count2) >= min_gallop:
+                    break
+            if done:
+                break
+
+            # Galloping: copy whole blocks while it keeps paying off.
+            while True:
+                count1 = _gallop_right(a[cursor2], tmp, cursor1, len1, 0)
+                if count1:
+                    a[dest:dest + count1] = tmp[cursor1:cursor1 + count1]
+                    dest += count1
+                    cursor1 += count1
+                    len1 -= count1
+                    if len1 <= 1:
+                        done = True
+                        break
+                a[dest] = a[cursor2]
+                dest += 1
+                cursor2 += 1
+                len2 -= 1
+                if len2 == 0:
+                    done = True
+                    break
+
+                count2 = _gallop_left(tmp[cursor1], a, cursor2, len2, 0)
+                if count2:
+                    a[dest:dest + count2] = a[cursor2:cursor2 + count2]
+                    dest += count2
+                    cursor2 += count2
+                    len2 -= count2
+                    if len2 == 0:
+                        done = True
+                        break
+                a[dest] = tmp[cursor1]
+                dest += 1
+                cursor1 += 1
+                len1 -= 1
+                if len1 == 1:
+                    done = True
+                    break
+
+                min_gallop -= 1
+                if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                    break
+            if done:
+                break
+            if min_gallop < 0:
+                min_gallop = 0
+            min_gallop += 2  # Penalty for leaving gallop mode
+
+        self.min_gallop = max(1, min_gallop)
+        if len1 == 1:
+            a[dest:dest + len2] = a[cursor2:cursor2 + len2]
+            a[dest + len2] = tmp[cursor1]
+        elif len1:
+            a[dest:dest + len1] = tmp[cursor1:cursor1 + len1]
+
+    def _merge_hi(self, base1, len1, base2, len2):
+        """
+        Merge two adjacent runs right to left; run2 (the shorter one)
+        is copied into the scratch buffer first.
+        """
+        a = self.a
+        tmp = self._scratch(len2)
+        tmp[0:len2] = a[base2:base2 + len2]
+        cursor1 = base1 + len1 - 1
+        cursor2 = len2 - 1
+        dest = base2 + len2 - 1
+
+        a[dest] = a[cursor1]
+        dest -= 1
+        cursor1 -= 1
+        len1 -= 1
+        if len1 == 0:
+            a[dest - len2 + 1:dest + 1] = tmp[0:len2]
+            return
+        if len2 == 1:
+            dest -= len1
+            cursor1 -= len1
+            a[dest + 1:dest + 1 + len1] = a[cursor1 + 1:cursor1 + 1 + len1]
+            a[dest] = tmp[cursor2]
+            return
+
+        min_gallop = self.min_gallop
+        done = False
+        while not done:
+            count1 = count2 = 0
+
+            while True:
+                if tmp[cursor2] < a[cursor1]:
+                    a[dest] = a[cursor1]
+                    dest -= 1
+                    cursor1 -= 1
+                    count1 += 1
+                    count2 = 0
+                    len1 -= 1
+                    if len1 == 0:
+                        done = True
+                        break
+                else:
+                    a[dest] = tmp[cursor2]
+                    dest -= 1
+                    cursor2 -= 1
+                    count2 += 1
+                    count1 = 0
+                    len2 -= 1
+                    if len2 == 1:
+                        done = True
+                        break
+                if (count1 | count2) >= min_gallop:
+                    break
+            if done:
+                break
+
+            while True:
+                count1 = len1 - _gallop_right(tmp[cursor2], a, base1, len1, len1 - 1)
+                if count1:
+                    dest -= count1
+                    cursor1 -= count1
+                    len1 -= count1
+                    a[dest + 1:dest + 1 + count1] = a[cursor1 + 1:cursor1 + 1 + count1]
+                    if len1 == 0:
+                        done = True
+                        break
+                a[dest] = tmp[cursor2]
+                dest -= 1
+                cursor2 -= 1
+                len2 -= 1
+                if len2 == 1:
+                    done = True
+                    break
+
+                count2 = len2 - _gallop_left(a[cursor1], tmp, 0, len2, len2 - 1)
+                if count2:
+                    dest -= count2
+                    cursor2 -= count2
+                    len2 -= count2
+                    a[dest + 1:dest + 1 + count2] = tmp[cursor2 + 1:cursor2 + 1 + count2]
+                    if len2 <= 1:
+                        done = True
+                        break
+                a[dest] = a[cursor1]
+                dest -= 1
+                cursor1 -= 1
+                len1 -= 1
+                if len1 == 0:
+                    done = True
+                    break
+
+                min_gallop -= 1
+                if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                    break
+            if done:
+                break
+            if min_gallop < 0:
+                min_gallop = 0
+            min_gallop += 2
+
+        self.min_gallop = max(1, min_gallop)
+        if len2 == 1:
+            dest -= len1
+            cursor1 -= len1
+            a[dest + 1:dest + 1 + len1] = a[cursor1 + 1:cursor1 + 1 + len1]
+            a[dest] = tmp[cursor2]
+        elif len2:
+            a[dest - len2 + 1:dest + 1] = tmp[0:len2]
+
+
+def hybrid_sort(arr, key=None, reverse=False):
+    """
+    Sort the list in place using a run-detecting hybrid of Insertion Sort
+    and Merge Sort (the approach popularised by Timsort).
+    Natural ascending/descending runs are detected, short runs are
+    extended with binary insertion, and runs are merged with galloping
+    through a single reusable scratch buffer. Already (or nearly) sorted
+    input is handled in close to O(n) time. The sort is stable.
+
+    Parameters:
+    arr (list): The list to sort.
+    key (callable, optional): Computes the sort key of each element;
+        each key is computed only once.
+    reverse (bool): Sort in descending order, keeping equal elements
+        in their original order.
+
+    Returns:
+    list: The same list, sorted.
+    """
+    if len(arr) < 2:
+        return arr
+
+    # Reversing before and after a stable ascending sort gives a stable
+    # descending sort.
+    if reverse:
+        arr.reverse()
+
+    if key is None:
+        _HybridSorter(arr).sort()
+    else:
+        # The index breaks ties, so elements themselves are never compared.
+        decorated = [(key(item), i, item) for i, item in enumerate(arr)]
+        _HybridSorter(decorated).sort()
+        arr[:] = [item for _, _, item in decorated]
+
+    if reverse:
+        arr.reverse()
+    return arr
+
+
+# ----------------------------
+# Counting Sort and Radix Sort
+# ----------------------------
+RADIX_BITS = 8
+COUNTING_RANGE_SLACK = 1 << 16  # NumPy counting_sort falls back to radix_sort
+                                # when the range exceeds 4 * n + this
+
+
+def _numpy_int_view(arr):
+    """
+    Return arr as a NumPy integer array sharing its memory (a NumPy
+    integer array itself, or an integer array.array via np.frombuffer),
+    or None when NumPy is unavailable or arr holds other types.
+    """
+    if np is None:
+        return None
+    if isinstance(arr, np.ndarray):
+        return arr if np.issubdtype(arr.dtype, np.integer) else None
+    if isinstance(arr, array) and arr.typecode in "bBhHiIlLqQ":
+        return np.frombuffer(arr, dtype=arr.typecode)
+    return None
+
+
+def _as_uint64_keys(arr):
+    """Map a NumPy integer array to order-preserving unsigned 64-bit keys."""
+    if np.issubdtype(arr.dtype, np.signedinteger):
+        # Flipping the sign bit orders signed values as unsigned ones.
+        return arr.astype(np.int64).view(np.uint64) ^ np.uint64(1 << 63)
+    return arr.astype(np.uint64)
+
+
+def _from_uint64_keys(keys, dtype):
+    """Inverse of _as_uint64_keys."""
+    if np.issubdtype(dtype, np.signedinteger):
+        return (keys ^ np.uint64(1 << 63)).view(np.int64).astype(dtype)
+    return keys.astype(dtype)
+
+
+def _write_back(arr, result):
+    """Replace the contents of a list or array.array with result."""
+    if isinstance(arr, array):
+        arr[:] = array(arr.typecode, result)
+    else:
+        arr[:] = result
+
+
+def counting_sort(arr):
+    """
+    Sort a list, array.array or NumPy array of integers in place
+    using Counting Sort.
+    Counts the occurrences of each value between the minimum and the
+    maximum and rewrites the input from the counts, in O(n + range) time.
+    Best suited to keys with a small range (e.g. small IDs, bytes).
+    NumPy arrays and integer array.arrays are counted with NumPy; their
+    offsets from the minimum are computed in unsigned 64-bit arithmetic,
+    so the full int64/uint64 range works. When the range is much larger
+    than the input (over 4 * n + COUNTING_RANGE_SLACK) the count array
+    would dwarf the data, so these inputs are radix sorted instead.
+
+    Returns:
+    The same sequence, sorted.
+    """
+    if len(arr) < 2:
+        return arr
+
+    view = _numpy_int_view(arr)
+    if view is not None:
+        keys = _as_uint64_keys(view)
+        lo = keys.min()
+        if int(keys.max() - lo) > 4 * len(keys) + COUNTING_RANGE_SLACK:
+            _numpy_radix_sort(view)
+            return arr
+        counts = np.bincount((keys - lo).astype(np.intp))
+        values = np.arange(len(counts), dtype=np.uint64) + lo
+        view[...] = np.repeat(_from_uint64_keys(values, view.dtype), counts)
+        return arr
+
+    lo, hi = min(arr), max(arr)
+    counts = [0] * (hi - lo + 1)
+    for value in arr:
+        counts[value - lo] += 1
+
+    result = []
+    for offset, count in enumerate(counts):
+        if count:
+            result += [lo + offset] * count
+    _write_back(arr, result)
+    return arr
+
+
+def _numpy_radix_sort(arr):
+    """
+    LSD radix sort of a NumPy integer array in place.
+    Values are mapped to order-preserving unsigned 64-bit keys, and each
+    pass does a stable 8-bit counting pass over one digit.
+    """
+    keys = _as_uint64_keys(arr)
+
+    # Digits above the highest bit where min and max differ are
+    # shared by every key, so they need no pass.
+    bits = int(keys.max() ^ keys.min()).bit_length()
+    order = np.arange(len(arr))
+    mask = np.uint64((1 << RADIX_BITS) - 1)
+    for shift in range(0, bits, RADIX_BITS):
+        digits = ((keys[order] >> np.uint64(shift)) & mask).astype(np.uint8)
+        order = order[np.argsort(digits, kind="stable")]
+    arr[...] = arr[order]
+    return arr
+
+
+def _radix_sort_ints(values, keys):
+    """
+    LSD radix sort of values by their integer keys (values themselves
+    when keys is None). Returns a new sorted list.
+    """
+    sort_keys = values if keys is None else keys
+    lo = min(sort_keys)
+    bits = (max(sort_keys) - lo).bit_length()
+    mask = (1 << RADIX_BITS) - 1
+
+    if keys is None:
+        items = [value - lo for value in values]
+        for shift in range(0, bits, RADIX_BITS):
+            buckets = [[] for _ in range(1 << RADIX_BITS)]
+            for item in items:
+                buckets[(item >> shift) & mask].append(item)
+            items = [item for bucket in buckets for item in bucket]
+        return [item + lo for item in items]
+
+    items = [(k - lo, value) for k, value in zip(keys, values)]
+    for shift in range(0, bits, RADIX_BITS):
+        buckets = [[] for _ in range(1 << RADIX_BITS)]
+        for item in items:
+            buckets[(item[0] >> shift) & mask].append(item)
+        items = [item for bucket in buckets for item in bucket]
+    return [value for _, value in items]
+
+
+def _radix_sort_bytes(values, keys):
+    """
+    LSD radix sort of values by their bytes keys (values themselves
+    when keys is None), one byte position per pass from the last.
+    A missing byte sorts before every present byte, so shorter keys
+    come before longer keys that extend them. Returns a new sorted list.
+    """
+    items = list(zip(values if keys is None else keys, values))
+    width = max(len(k) for k, _ in items)
+    for pos in range(width - 1, -1, -1):
+        # Bucket 0 holds keys too short to have a byte at pos.
+        buckets = [[] for _ in range(257)]
+        for item in items:
+            k = item[0]
+            buckets[k[pos] + 1 if pos < len(k) else 0].append(item)
+        items = [item for bucket in buckets for item in bucket]
+    return [value for _, value in items]
+
+
+def radix_sort(arr, key=None):
+    """
+    Sort a list, array.array or NumPy array in place using LSD Radix Sort.
+    Keys must be integers (any sign, e.g. IDs or timestamps) or bytes of
+    bounded length. Runs in O(n * w) time for w-digit keys and is stable.
+    NumPy integer arrays and integer array.arrays are sorted with
+    vectorized NumPy passes.
+
+    Parameters:
+    arr: The sequence to sort.
+    key (callable, optional): Computes the integer or bytes key of each
+        element; each key is computed only once.
+
+    Returns:
+    The same sequence, sorted.
+    """
+    if len(arr) < 2:
+        return arr
+
+    view = _numpy_int_view(arr) if key is None else None
+    if view is not None:
+        _numpy_radix_sort(view)
+        return arr
+
+    values = list(arr)
+    keys = None if key is None else [key(value) for value in values]
+    first = values[0] if keys is None else keys[0]
+    if isinstance(first, (bytes, bytearray)):
+        result = _radix_sort_bytes(values, keys)
+    else:
+        result = _radix_sort_ints(values, keys)
+    _write_back(arr, result)
+    return arr
+
+
 # ----------------------------
 # Example Usage
 # ----------------------------
@@ -120,3 +1015,14 @@ if __name__ == "__main__":
     print("Insertion Sort:", insertion_sort(arr.copy()))
     print("Bubble Sort:", bubble_sort(arr.copy()))
     print("Merge Sort:", merge_sort(arr.copy()))
+    print("Merge Sort (bottom-up):", merge_sort(arr.copy(), mode="bottom_up"))
+    print("Hybrid Sort:", hybrid_sort(arr.copy()))
+    print("Counting Sort:", counting_sort(arr.copy()))
+    print("Radix Sort:", radix_sort(arr.copy()))
+
+    if np is not None:
+        top = 2**64 - 1
+        near_top = np.array([top, top - 4, top - 2, top - 4], dtype=np.uint64)
+        full_range = np.array([top, 2**63, 0, top - 1], dtype=np.uint64)
+        print("Counting Sort (uint64 near 2**64):", counting_sort(near_top).tolist())
+        print("Counting Sort (full uint64 range):", counting_sort(full_range).tolist())